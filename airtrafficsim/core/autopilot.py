@@ -323,8 +323,8 @@ class Autopilot:
         self.mach = np.minimum(self.mach, traffic.max_mach)
 
         # Handle change in speed mode. 
-        self.mach = np.where(traffic.speed_mode == SpeedMode.CAS, traffic.perf.tas_to_mach(traffic.perf.cas_to_tas(Unit.kts2mps(self.cas), traffic.weather.p, traffic.weather.rho), traffic.weather.T), self.mach)
-        self.cas = np.where(traffic.speed_mode == SpeedMode.MACH, Unit.mps2kts(traffic.perf.tas_to_cas(traffic.perf.mach_to_tas(self.mach, traffic.weather.T), traffic.weather.p, traffic.weather.rho)), self.cas)
+        self.mach = np.where(traffic.speed_mode == SpeedMode.CAS, traffic.perf.tas_to_mach_from_a(traffic.perf.cas_to_tas(Unit.kts2mps(self.cas), traffic.weather.p, traffic.weather.rho), traffic.weather.a), self.mach)
+        self.cas = np.where(traffic.speed_mode == SpeedMode.MACH, Unit.mps2kts(traffic.perf.tas_to_cas(traffic.perf.mach_to_tas_from_a(self.mach, traffic.weather.a), traffic.weather.p, traffic.weather.rho)), self.cas)
 
         # Speed mode
         self.speed_mode = np.where(traffic.speed_mode == SpeedMode.CAS,
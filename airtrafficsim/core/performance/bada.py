@@ -1,11 +1,181 @@
 """Aircraft performance class calculation using BADA 3.15"""
+from collections import namedtuple
+from functools import lru_cache
+import math
+import os
 from pathlib import Path
+import zipfile
 import numpy as np
+from numba import njit
 
+from airtrafficsim.core.performance.kernel import JIT_OPTIONS, broadcast_1d
 from airtrafficsim.utils.enums import APSpeedMode, EngineType, Config, FlightPhase, VerticalMode
 from airtrafficsim.utils.unit_conversion import Unit
 
 
+GlobalParameters = namedtuple('GlobalParameters', [
+    'A_L_MAX_CIV', 'A_N_MAX_CIV', 'PHI_NORM_CIV_TOLD', 'PHI_NORM_CIV_OTHERS', 'PHI_NORM_MIL', 'PHI_MAX_CIV_TOLD',
+    'PHI_MAX_CIV_HOLD', 'PHI_MAX_CIV_OTHERS', 'PHI_MAX_MIL', 'C_DES_EXP', 'C_TH_TO', 'C_TCR', 'H_MAX_TO',
+    'H_MAX_IC', 'H_MAX_AP', 'H_MAX_LD', 'C_V_MIN', 'C_V_MIN_TO', 'V_D_CL_1', 'V_D_CL_2', 'V_D_CL_3', 'V_D_CL_4',
+    'V_D_CL_5', 'V_D_CL_6', 'V_D_CL_7', 'V_D_CL_8', 'V_D_DSE_1', 'V_D_DSE_2', 'V_D_DSE_3', 'V_D_DSE_4',
+    'V_D_DSE_5', 'V_D_DSE_6', 'V_D_DSE_7', 'V_HOLD_1', 'V_HOLD_2', 'V_HOLD_3', 'V_HOLD_4', 'V_BACKTRACK',
+    'V_TAXI', 'V_APRON', 'V_GATE', 'C_RED_PISTON', 'C_RED_TURBO', 'C_RED_JET'])
+"""Global aircraft parameters of BADA.GPF in file order (Section 5)"""
+
+
+# ----------------------------  Numba kernels -----------------------------------------
+# Element-wise BADA equations compiled into single loops over the aircraft arrays.
+# See the corresponding private methods of the Bada class for the parameters.
+
+@njit(**JIT_OPTIONS)
+def _nominal_fuel_flow(engine_type, c_f1, inv_c_f2, V_tas, Thr):
+    """Nominal fuel flow of one aircraft [kg/min] (equations 3.9-1~3 and 3.9-7)"""
+    if engine_type == EngineType.JET.value:
+        return c_f1 * (1.0 + V_tas*inv_c_f2) * Thr                      # Equation 3.9-1 and 3.9-3
+    elif engine_type == EngineType.TURBOPROP.value:
+        return c_f1 * (1.0 - V_tas*inv_c_f2) * (V_tas/1000.0) * Thr     # Equation 3.9-2 and 3.9-3
+    elif engine_type == EngineType.PISTON.value:
+        return c_f1                                                     # Equation 3.9-7
+    return 0.0
+
+
+@njit(**JIT_OPTIONS)
+def _minimum_fuel_flow(engine_type, c_f3, inv_c_f4, H_p):
+    """Minimum fuel flow of one aircraft [kg/min] (equations 3.9-4 and 3.9-8)"""
+    if engine_type != EngineType.PISTON.value:
+        return c_f3 * (1.0 - H_p*inv_c_f4)                              # Equation 3.9-4
+    return c_f3                                                         # Equation 3.9-8
+
+
+@njit(**JIT_OPTIONS)
+def _cal_fuel_flow(flight_phase, engine_type, c_f1, inv_c_f2, c_f3, inv_c_f4, c_fcr, V_tas, Thr, H_p, fuel_flow):
+    """Fuel flow of each aircraft in its flight phase, written to fuel_flow [kg/min] (Section 3.9)"""
+    for i in range(V_tas.shape[0]):
+        if flight_phase[i] == FlightPhase.CRUISE.value:
+            # Cruise (Equation 3.9-6 and 3.9-9)
+            fuel_flow[i] = _nominal_fuel_flow(engine_type[i], c_f1[i], inv_c_f2[i], V_tas[i], Thr[i]) * c_fcr[i]
+        elif flight_phase[i] == FlightPhase.DESCENT.value:
+            # Idle descent (Equation 3.9-4 and 3.9-8)
+            fuel_flow[i] = _minimum_fuel_flow(engine_type[i], c_f3[i], inv_c_f4[i], H_p[i])
+        elif flight_phase[i] == FlightPhase.APPROACH.value or flight_phase[i] == FlightPhase.LANDING.value:
+            # Approach and landing
+            f_min = _minimum_fuel_flow(engine_type[i], c_f3[i], inv_c_f4[i], H_p[i])
+            if engine_type[i] != EngineType.PISTON.value:
+                # Equation 3.9-5
+                fuel_flow[i] = max(_nominal_fuel_flow(engine_type[i], c_f1[i], inv_c_f2[i], V_tas[i], Thr[i]), f_min)
+            else:
+                # Equation 3.9-8
+                fuel_flow[i] = f_min
+        else:
+            # Others (Equation 3.9-1~3 and 3.9-7)
+            fuel_flow[i] = _nominal_fuel_flow(engine_type[i], c_f1[i], inv_c_f2[i], V_tas[i], Thr[i])
+    return fuel_flow
+
+
+@njit(**JIT_OPTIONS)
+def _max_climb_thrust(engine_type, c_tc_1, inv_c_tc_2, c_tc_3, c_tc_4, c_tc_5, H_p, V_tas, d_T):
+    """Maximum climb thrust of one aircraft [N] (Section 3.7.1)"""
+    # Maximum climb thrust at standard atmosphere conditions (Equations 3.7-1~3)
+    if engine_type == EngineType.JET.value:
+        thr_max_climb_isa = c_tc_1 * (1.0 - H_p*inv_c_tc_2 + c_tc_3 * H_p * H_p)
+    elif engine_type == EngineType.TURBOPROP.value:
+        thr_max_climb_isa = c_tc_1/V_tas * (1.0 - H_p*inv_c_tc_2) + c_tc_3
+    elif engine_type == EngineType.PISTON.value:
+        thr_max_climb_isa = c_tc_1 * (1.0 - H_p*inv_c_tc_2) + c_tc_3/V_tas
+    else:
+        thr_max_climb_isa = 0.0
+    # Corrected for temperature deviation from ISA
+    d_T_eff = min(max(max(c_tc_5, 0.0) * (d_T - c_tc_4), 0.0), 0.4)
+    return thr_max_climb_isa * (1.0 - d_T_eff)
+
+
+@njit(**JIT_OPTIONS)
+def _update_configuration(C_V_MIN, H_MAX_TO, H_MAX_IC, H_MAX_AP, H_MAX_LD, v_stall_cr, v_stall_ap, V_cas, H_p, vertical_mode):
+    """Aircraft configuration [Config enum] (Section 3.5)"""
+    configuration = np.empty(H_p.shape[0], dtype=np.int64)
+    for i in range(H_p.shape[0]):
+        climb = vertical_mode[i] == VerticalMode.CLIMB.value
+        descent = vertical_mode[i] == VerticalMode.DESCENT.value
+        v_min_cr = C_V_MIN * v_stall_cr[i] + 10.0
+        v_min_ap = C_V_MIN * v_stall_ap[i] + 10.0
+        if climb and H_p[i] <= H_MAX_TO:
+            configuration[i] = Config.TAKEOFF.value
+        elif climb and H_p[i] > H_MAX_TO and H_p[i] < H_MAX_IC:
+            configuration[i] = Config.INITIAL_CLIMB.value
+        elif H_p[i] > H_MAX_IC or (descent and V_cas[i] >= v_min_cr):
+            configuration[i] = Config.CLEAN.value
+        elif (descent and V_cas[i] < v_min_cr and H_p[i] > H_MAX_LD and H_p[i] <= H_MAX_AP) or \
+                (V_cas[i] < v_min_cr and V_cas[i] >= v_min_ap and H_p[i] <= H_MAX_LD):
+            configuration[i] = Config.APPROACH.value
+        elif descent and H_p[i] < H_MAX_LD and V_cas[i] < v_min_ap:
+            configuration[i] = Config.LANDING.value
+        else:
+            configuration[i] = Config.CLEAN.value
+    return configuration
+
+
+@njit(**JIT_OPTIONS)
+def _cal_aerodynamic_drag(c_d0_cr, c_d2_cr, c_d0_ap, c_d2_ap, c_d0_ld_total, c_d2_ld, S, G_0, V_tas, bank_angle, m, rho, configuration, c_des_exp, drag):
+    """Aerodynamic drag [N] (Section 3.6.1), written to drag"""
+    for i in range(V_tas.shape[0]):
+        if V_tas[i] == 0.0:
+            drag[i] = 0.0
+            continue
+        # Lift coefficient (Equation 3.6-1)
+        c_L = 2.0 * m[i] * G_0 / rho[i] / (V_tas[i] * V_tas[i]) / S[i] / math.cos(math.radians(bank_angle[i]))
+
+        # Drag coefficient (Equation 3.6-2~4), approach and landing fall back to the clean configuration when their coefficients are set to 0
+        if configuration[i] == Config.APPROACH.value and c_d2_ap[i] != 0:
+            c_D = c_d0_ap[i] + c_d2_ap[i] * c_L * c_L                    # Equation 3.6-3
+        elif configuration[i] == Config.LANDING.value and c_d2_ld[i] != 0:
+            c_D = c_d0_ld_total[i] + c_d2_ld[i] * c_L * c_L             # Equation 3.6-4
+        else:
+            c_D = c_d0_cr[i] + c_d2_cr[i] * c_L * c_L                    # Equation 3.6-2
+
+        # Drag force
+        drag[i] = c_D * rho[i] * V_tas[i] * V_tas[i] * S[i] / 2.0 * c_des_exp[i]
+
+
+@njit(**JIT_OPTIONS)
+def _descent_thrust(c_d2_ap, h_p_des, c_tdes_high, c_tdes_low, c_tdes_app, c_tdes_ld, H_MAX_AP, H_p, Thr_max_climb, configuration):
+    """Descent thrust of one aircraft [N] (Section 3.7.3)"""
+    # When “non-clean” data (see Section 3.6.1) is available, H_p,des cannot be below H_max,AP.
+    if c_d2_ap != 0:
+        h_p_des_act = max(h_p_des, H_MAX_AP)
+    else:
+        h_p_des_act = h_p_des
+
+    if H_p > h_p_des_act:
+        return c_tdes_high * Thr_max_climb      # Equation 3.7-9
+    elif configuration == Config.CLEAN.value:
+        return c_tdes_low * Thr_max_climb       # Equation 3.7-10
+    elif configuration == Config.APPROACH.value:
+        return c_tdes_app * Thr_max_climb       # Equation 3.7-11
+    elif configuration == Config.LANDING.value:
+        return c_tdes_ld * Thr_max_climb        # Equation 3.7-12
+    return 0.0
+
+
+@njit(**JIT_OPTIONS)
+def _cal_thrust(climb, cruise, descent, engine_type, c_tc_1, inv_c_tc_2, c_tc_3, c_tc_4, c_tc_5, C_TCR,
+                c_d2_ap, h_p_des, c_tdes_high, c_tdes_low, c_tdes_app, c_tdes_ld, H_MAX_AP, H_p, V_tas, d_T, drag, configuration, thrust):
+    """Thrust of climbing, cruising and descending aircraft in one pass, written to thrust [N] (Section 3.7)"""
+    for i in range(H_p.shape[0]):
+        if not (climb[i] or cruise[i] or descent[i]):
+            thrust[i] = 0.0
+            continue
+        thr_max_climb = _max_climb_thrust(engine_type[i], c_tc_1[i], inv_c_tc_2[i], c_tc_3[i], c_tc_4[i], c_tc_5[i],
+                                          H_p[i], V_tas[i], d_T[i])
+        if climb[i]:
+            thrust[i] = thr_max_climb
+        elif cruise[i]:
+            thrust[i] = min(drag[i], C_TCR * thr_max_climb)             # Equation 3.7-8
+        else:
+            thrust[i] = _descent_thrust(c_d2_ap[i], h_p_des[i], c_tdes_high[i], c_tdes_low[i], c_tdes_app[i], c_tdes_ld[i],
+                                        H_MAX_AP, H_p[i], thr_max_climb, configuration[i])
+    return thrust
+
+
 class Bada:
     """
     BADA Performance class 
@@ -25,15 +195,28 @@ class Bada:
 
     """
 
-    def __init__(self):
+    __DATA_PATH = Path(__file__).parent.parent.parent.parent.resolve().joinpath('data/performance/BADA')
+    """Directory of the BADA data files"""
+
+    USE_FP64 = False
+    """Store the per-aircraft BADA coefficients in double instead of single precision (for validation runs)"""
+
+    __PROCEDURE_SPEED_ALT = np.array([
+        [[1500, 3000, 4000, 5000, 6000, 10000], [500, 1000, 1500, 10000, np.nan, np.nan]],      # Climb: jet, turboprop and piston (Section 4.1)
+        [[3000, 6000, 14000, np.nan, np.nan, np.nan], [3000, 6000, 10000, np.nan, np.nan, np.nan]],  # Cruise: jet, turboprop and piston (Section 4.2)
+        [[1000, 1500, 2000, 3000, 6000, 10000], [500, 1000, 1500, 10000, np.nan, np.nan]]       # Descent: jet and turboprop, piston (Section 4.3)
+    ])
+    """Lower altitude bounds of the speed schedule ranges [phase, engine group, range] [ft] (padded with nan)"""
+
+    def __init__(self, N=100):
         """
         Initialize BADA performance parameters 
 
         Parameters
         ----------
         N: int
-            Number of aircrafts. Maximum size of performance array (pre-initialize to eliminate inefficient append)
-            TODO: Revise the initial estimate
+            Number of aircrafts. Initial size of performance array (pre-initialize to eliminate inefficient append).
+            The capacity is doubled when more aircraft are added.
         """
         # ----------------------------  Operations Performance File (OPF) section 3.11 -----------------------------------------
         # Aircraft type
@@ -53,6 +236,8 @@ class Bada:
         """maximum mass [tones]"""
         self.__m_pyld = np.zeros([0])
         """maximum payload mass [tones]"""
+        self.__c_red = np.zeros([0])
+        """maximum reduction in power of the engine type [dimensionless] (section 5.11)"""
 
         # Flight envelope
         self.v_mo = np.zeros([0])
@@ -95,10 +280,20 @@ class Bada:
         """stall speed (AP) [knots (CAS)]"""
         self.__v_stall_ld = np.zeros([0])
         """stall speed (LD) [knots (CAS)]"""
+        self.__v_min = np.zeros([0, 6])
+        """minimum speed indexed by Config value, column 0 for any other configuration (Equation 3.5-2~3) [knots (CAS)]"""
         self.__c_lbo = np.zeros([0])
         """buffet onset lift coefficient (jet and TBP only) [dimensionless]"""
         self.__k = np.zeros([0])
         """buffeting gradient (Jet & TBP only) [dimensionless]"""
+        self.__Q_lbo = np.zeros([0])
+        """buffet onset Q term, -(c_lbo/k)^2/9 (Jet & TBP only) [dimensionless]"""
+        self.__c_lbo_k_cube = np.zeros([0])
+        """buffet onset cubic term, (-c_lbo/k)^3 (Jet & TBP only) [dimensionless]"""
+        self.__c_lbo_k_3 = np.zeros([0])
+        """buffet onset root offset, c_lbo/k/3 (Jet & TBP only) [dimensionless]"""
+        self.__c_d0_ld_total = np.zeros([0])
+        """parasitic drag coefficient (landing) including landing gear, c_d0_ld + c_d0_ldg [dimensionless]"""
 
         # Engine thrust
         self.__c_tc_1 = np.zeros([0])
@@ -111,6 +306,8 @@ class Bada:
         """1st thrust temperature coefficient [K]"""
         self.__c_tc_5 = np.zeros([0])
         """2nd thrust temperature coefficient [1/K]"""
+        self.__inv_c_tc_2 = np.zeros([0])
+        """reciprocal of 2nd maximum climb thrust coefficient [1/feet]"""
         self.__c_tdes_low = np.zeros([0])
         """low altitude descent thrust coefficient [dimensionless]"""
         self.__c_tdes_high = np.zeros([0])
@@ -137,6 +334,10 @@ class Bada:
         """2nd descent fuel flow coefficient [feet]"""
         self.__c_fcr = np.zeros([0])
         """cruise fuel flow correction coefficient [dimensionless]"""
+        self.__inv_c_f2 = np.zeros([0])
+        """reciprocal of 2nd thrust specific fuel consumption coefficient [1/knots]"""
+        self.__inv_c_f4 = np.zeros([0])
+        """reciprocal of 2nd descent fuel flow coefficient [1/feet]"""
 
         # Ground movement
         self.__tol = np.zeros([0])
@@ -181,119 +382,132 @@ class Bada:
         self.descent_schedule = np.zeros([0, 8])
         """Standard descent CAS schedule [knots*8] (section 4.3)"""
 
+        # Pre-allocated storage of the per-aircraft arrays above, which are views of the first n aircraft
+        self.__capacity = N
+        """Number of aircraft the storage can hold before growing"""
+        self.__n = 0
+        """Number of aircraft in the performance array"""
+        arrays = [(name, value) for name, value in vars(self).items() if isinstance(value, np.ndarray)]
+        self.__IDX = {name: i for i, name in enumerate(
+            [name for name, value in arrays if value.ndim == 1 and value.dtype == np.float64])}
+        """Row of each numerical per-aircraft parameter in the parameter matrix {attribute name: row}"""
+        self.__params = np.zeros((len(self.__IDX), N), dtype=np.float64 if self.USE_FP64 else np.float32)
+        """Parameter matrix with one contiguous row per parameter [parameter, aircraft] (BADA coefficients are given to less than single precision)"""
+        self.__buffer = {name: np.zeros((N,) + value.shape[1:], dtype=value.dtype)
+                         for name, value in arrays if name not in self.__IDX}
+        """Backing storage of the other per-aircraft arrays (wake category and speed schedules) {attribute name: array}"""
+
         # ----------------------------  Global Aircraft Parameters (GPF) section 5 -----------------------------------------
         # Read data from GPF file (section 6.8)
-        # 'CD', 1X, A15, 1X, A7, 1X, A16, 1x, A29, 1X, E10.5
-        if Path(__file__).parent.parent.parent.parent.resolve().joinpath('./data/performance/BADA/BADA.GPF').is_file():
-            GPF = np.genfromtxt(Path(__file__).parent.parent.parent.parent.resolve().joinpath('./data/performance/BADA/BADA.GPF'),
-                                delimiter=[3, 16, 8, 17, 29, 12], dtype="U2,U15,U7,U16,U29,f8", comments="CC", autostrip=True, skip_footer=1)
+        if self.__DATA_PATH.joinpath('BADA.GPF').is_file():
+            GPF = self.__load_gpf()
 
             # Maximum acceleration
-            self.__A_L_MAX_CIV = GPF[0][5]
+            self.__A_L_MAX_CIV = GPF.A_L_MAX_CIV
             """Maximum longitudinal acceleration for civil flights [2 ft/s^2]"""
-            self.__A_N_MAX_CIV = GPF[1][5]
+            self.__A_N_MAX_CIV = GPF.A_N_MAX_CIV
             """Maximum normal acceleration for civil flights [5 ft/s^2]"""
 
             # Bank angles
-            self.__PHI_NORM_CIV_TOLD = GPF[2][5]
+            self.__PHI_NORM_CIV_TOLD = GPF.PHI_NORM_CIV_TOLD
             """Nominal bank angles fpr civil flight during TO and LD [15 deg]"""
-            self.__PHI_NORM_CIV_OTHERS = GPF[3][5]
+            self.__PHI_NORM_CIV_OTHERS = GPF.PHI_NORM_CIV_OTHERS
             """Nominal bank angles for civil flight during all other phases [30 deg]"""
-            self.__PHI_NORM_MIL = GPF[4][5]
+            self.__PHI_NORM_MIL = GPF.PHI_NORM_MIL
             """Nominal bank angles for military flight (all phases) [50 deg]"""
-            self.__PHI_MAX_CIV_TOLD = GPF[5][5]
+            self.__PHI_MAX_CIV_TOLD = GPF.PHI_MAX_CIV_TOLD
             """Maximum bank angles for civil flight during TO and LD [25 deg]"""
-            self.__PHI_MAX_CIV_HOLD = GPF[6][5]
+            self.__PHI_MAX_CIV_HOLD = GPF.PHI_MAX_CIV_HOLD
             """Maximum bank angles for civil flight during HOLD [35 deg]"""
-            self.__PHI_MAX_CIV_OTHERS = GPF[7][5]
+            self.__PHI_MAX_CIV_OTHERS = GPF.PHI_MAX_CIV_OTHERS
             """Maximum bank angles for civil flight during all other phases [45 deg]"""
-            self.__PHI_MAX_MIL = GPF[8][5]
+            self.__PHI_MAX_MIL = GPF.PHI_MAX_MIL
             """Maximum bank angles for military flight (all phases) [70 deg]"""
 
             # Expedited descent (drag multiplication factor during expedited descent to simulate use of spoilers)
-            self.__C_DES_EXP = GPF[9][5]
+            self.__C_DES_EXP = GPF.C_DES_EXP
             """Expedited descent factor [1.6]"""
 
             # Thrust factors
-            self.__C_TCR = GPF[11][5]
+            self.__C_TCR = GPF.C_TCR
             """Maximum cruise thrust coefficient [0.95] (postition different between GPF and user menu)"""
-            self.__C_TH_TO = GPF[10][5]
+            self.__C_TH_TO = GPF.C_TH_TO
             """Take-off thrust coefficient [1.2] (no longer used since BADA 3.0) (postition different between GPF and user menu)"""
 
             # Configuration altitude threshold
-            self.__H_MAX_TO = GPF[12][5]
+            self.__H_MAX_TO = GPF.H_MAX_TO
             """Maximum altitude threshold for take-off [400 ft]"""
-            self.__H_MAX_IC = GPF[13][5]
+            self.__H_MAX_IC = GPF.H_MAX_IC
             """Maximum altitude threshold for initial climb [2,000 ft]"""
-            self.__H_MAX_AP = GPF[14][5]
+            self.__H_MAX_AP = GPF.H_MAX_AP
             """Maximum altitude threshold for approach [8,000 ft]"""
-            self.__H_MAX_LD = GPF[15][5]
+            self.__H_MAX_LD = GPF.H_MAX_LD
             """Maximum altitude threshold for landing [3,000 ft]"""
 
             # Minimum speed coefficient
-            self.__C_V_MIN = GPF[16][5]
+            self.__C_V_MIN = GPF.C_V_MIN
             """Minimum speed coefficient (all other phases) [1.3]"""
-            self.__C_V_MIN_TO = GPF[17][5]
+            self.__C_V_MIN_TO = GPF.C_V_MIN_TO
             """Minimum speed coefficient for take-off [1.2]"""
 
             # Speed schedules
-            self.__V_D_CL_1 = GPF[18][5]
+            self.__V_D_CL_1 = GPF.V_D_CL_1
             """Climb speed increment below 1,500 ft (jet) [5 knot CAS]"""
-            self.__V_D_CL_2 = GPF[19][5]
+            self.__V_D_CL_2 = GPF.V_D_CL_2
             """Climb speed increment below 3,000 ft (jet) [10 knot CAS]"""
-            self.__V_D_CL_3 = GPF[20][5]
+            self.__V_D_CL_3 = GPF.V_D_CL_3
             """Climb speed increment below 4,000 ft (jet) [30 knot CAS]"""
-            self.__V_D_CL_4 = GPF[21][5]
+            self.__V_D_CL_4 = GPF.V_D_CL_4
             """Climb speed increment below 5,000 ft (jet) [60 knot CAS]"""
-            self.__V_D_CL_5 = GPF[22][5]
+            self.__V_D_CL_5 = GPF.V_D_CL_5
             """Climb speed increment below 6,000 ft (jet) [80 knot CAS]"""
-            self.__V_D_CL_6 = GPF[23][5]
+            self.__V_D_CL_6 = GPF.V_D_CL_6
             """Climb speed increment below 500 ft (turbo/piston) [20 knot CAS]"""
-            self.__V_D_CL_7 = GPF[24][5]
+            self.__V_D_CL_7 = GPF.V_D_CL_7
             """Climb speed increment below 1,000 ft (turbo/piston) [30 knot CAS]"""
-            self.__V_D_CL_8 = GPF[25][5]
+            self.__V_D_CL_8 = GPF.V_D_CL_8
             """ Climb speed increment below 1,500 ft (turbo/piston) [35 knot CAS]"""
-            self.__V_D_DSE_1 = GPF[26][5]
+            self.__V_D_DSE_1 = GPF.V_D_DSE_1
             """Descent speed increment below 1,000 ft (jet/turboprop) [5 knot CAS]"""
-            self.__V_D_DSE_2 = GPF[27][5]
+            self.__V_D_DSE_2 = GPF.V_D_DSE_2
             """Descent speed increment below 1,500 ft (jet/turboprop) [10 knot CAS]"""
-            self.__V_D_DSE_3 = GPF[28][5]
+            self.__V_D_DSE_3 = GPF.V_D_DSE_3
             """Descent speed increment below 2,000 ft (jet/turboprop) [20 knot CAS]"""
-            self.__V_D_DSE_4 = GPF[29][5]
+            self.__V_D_DSE_4 = GPF.V_D_DSE_4
             """Descent speed increment below 3,000 ft (jet/turboprop) [50 knot CAS]"""
-            self.__V_D_DSE_5 = GPF[30][5]
+            self.__V_D_DSE_5 = GPF.V_D_DSE_5
             """Descent speed increment below 500 ft (piston) [5 knot CAS]"""
-            self.__V_D_DSE_6 = GPF[31][5]
+            self.__V_D_DSE_6 = GPF.V_D_DSE_6
             """Descent speed increment below 1,000 ft (piston) [10 knot CAS]"""
-            self.__V_D_DSE_7 = GPF[32][5]
+            self.__V_D_DSE_7 = GPF.V_D_DSE_7
             """Descent speed increment below 1,500 ft (piston) [20 knot CAS]"""
 
             # Holding speeds
-            self.__V_HOLD_1 = GPF[33][5]
+            self.__V_HOLD_1 = GPF.V_HOLD_1
             """Holding speed below FL140 [230 knot CAS]"""
-            self.__V_HOLD_2 = GPF[34][5]
+            self.__V_HOLD_2 = GPF.V_HOLD_2
             """Holding speed between FL140 and FL220 [240 knot CAS]"""
-            self.__V_HOLD_3 = GPF[35][5]
+            self.__V_HOLD_3 = GPF.V_HOLD_3
             """Holding speed between FL220 and FL340 [265 knot CAS]"""
-            self.__V_HOLD_4 = GPF[36][5]
+            self.__V_HOLD_4 = GPF.V_HOLD_4
             """Holding speed above FL340 [0.83 Mach]"""
 
             # Ground speed
-            self.__V_BACKTRACK = GPF[37][5]
+            self.__V_BACKTRACK = GPF.V_BACKTRACK
             """Runway backtrack speed [35 knot CAS]"""
-            self.__V_TAXI = GPF[38][5]
+            self.__V_TAXI = GPF.V_TAXI
             """Taxi speed [15 knot CAS]"""
-            self.__V_APRON = GPF[39][5]
+            self.__V_APRON = GPF.V_APRON
             """Apron speed [10 knot CAS]"""
-            self.__V_GATE = GPF[40][5]
+            self.__V_GATE = GPF.V_GATE
             """Gate speed [5 knot CAS]"""
 
             # Reduced power coefficient
-            self.__C_RED_TURBO = GPF[42][5]
+            self.__C_RED_TURBO = GPF.C_RED_TURBO
             """Maximum reduction in power for turboprops [0.25] (postition different between GPF and user menu)"""
-            self.__C_RED_PISTON = GPF[41][5]
+            self.__C_RED_PISTON = GPF.C_RED_PISTON
             """Maximum reduction in power for pistons [0.0] (postition different between GPF and user menu)"""
-            self.__C_RED_JET = GPF[43][5]
+            self.__C_RED_JET = GPF.C_RED_JET
             """Maximum reduction in power for jets [0.15]"""
 
             # Delete variable to free memory
@@ -329,8 +543,8 @@ class Bada:
 
         # ----------------------------  SYNONYM FILE FORMAT (SYNONYM.NEW) section 6.3 -----------------------------------------
         # | 'CD' | SUPPORT TYPE (-/*) | AIRCRAFT Code | MANUFACTURER | NAME OR MODEL | FILE NAME | ICAO (Y/N) |
-        self.__SYNONYM = np.genfromtxt(Path(__file__).parent.parent.parent.parent.resolve().joinpath('./data/performance/BADA/SYNONYM.NEW'), delimiter=[3, 2, 7, 20, 25, 8, 5], names=[
-                                       'CD', 'ST', 'ACCODE', 'MANUFACTURER', 'MODEL', 'FILENAME', 'ICAO'], dtype="U2,U1,U4,U18,U25,U6,U1", comments="CC", autostrip=True, skip_footer=1, encoding='unicode_escape')
+        self.__SYNONYM, self.__SYNONYM_INDEX = self.__load_synonym()
+        """Data lines of SYNONYM.NEW and row index of each aircraft code (shared by all instances)"""
 
     def add_aircraft(self, icao, mass_class=2):
         """
@@ -355,103 +569,160 @@ class Bada:
         TODO:
         """
 
-        # Get file name by searching in SYNONYM.NEW
-        row = np.where(self.__SYNONYM['ACCODE'] == icao)[
-            0][0]      # Get row index
+        n = self.__alloc_slots(1)[0]
+        self.__set_aircraft(n, self.__get_file_name(icao), mass_class)
+
+    def add_aircraft_batch(self, icaos, mass_classes=2):
+        """
+        Add multiple aircraft performance data to the performance array at once. Each aircraft type is read only once and copied to all aircraft of the same type.
+
+        Parameters
+        ----------
+        icaos: string[]
+            ICAO codes of the aircraft.
+
+        mass_classes: int or int[]
+            Aircraft mass for specific flight. To be used for APF. 1 = LO, 2 = AV, 3 = HI
+        """
+        icaos = np.asarray(icaos)
+        mass_classes = np.broadcast_to(mass_classes, icaos.shape)
+        slots = self.__alloc_slots(len(icaos))
+
+        # Fill the first aircraft of each unique (ICAO, mass class) pair
+        _, first, inv = np.unique(np.rec.fromarrays([icaos, mass_classes]), return_index=True, return_inverse=True)
+        for i in first:
+            self.__set_aircraft(slots[i], self.__get_file_name(icaos[i]), mass_classes[i])
+
+        # Copy them to the rest of the batch
+        self.__params[:, slots] = self.__params[:, slots[first]][:, inv]
+        for buffer in self.__buffer.values():
+            buffer[slots] = buffer[slots[first]][inv]
+
+    def __get_file_name(self, icao):
+        """
+        Get the BADA file name of an aircraft type by searching in SYNONYM.NEW
+
+        Parameters
+        ----------
+        icao: string
+            ICAO code of the specific aircraft.
+
+        Returns
+        -------
+        file_name: string
+            File name of the aircraft type
+        """
+        row = self.__SYNONYM_INDEX[icao]      # Get row index
         file_name = self.__SYNONYM[row][5]
 
         if(not file_name):
             print("No aircraft in SYNONYM.NEW")
 
-        # Get data from Operations Performance File (Section 6.4)
-        OPF = np.genfromtxt(Path(__file__).parent.parent.parent.parent.resolve().joinpath('./data/performance/BADA/', file_name+'.OPF'), delimiter=[
-                            3, 2, 2, 13, 13, 13, 13, 11], dtype="U2,U1,U2,f8,f8,f8,f8,f8", comments="CC", autostrip=True, skip_header=16, skip_footer=1)
+        return file_name
 
-        # 'CD', 3X, A6, 9X, I1, 12X, A9, 17X, A1 - aircraft type block - 1 data line
-        # | 'CD' | ICAO | # of engine | 'engines' | engine type ( Jet,  Turboprop  or  Piston) | wake category ( J (jumbo), H (heavy), M (medium) or L (light))
-        OPF_Actype = np.genfromtxt(Path(__file__).parent.parent.parent.parent.resolve().joinpath(
-            './data/performance/BADA/', file_name+'.OPF'), delimiter=[5, 15, 1, 12, 26, 1], dtype="U2,U6,i1,U7,U9,U1", comments="CC", autostrip=True, max_rows=1)
+    def __set_aircraft(self, n, file_name, mass_class):
+        """
+        Write the performance data of one aircraft type to a reserved slot of the performance array.
 
-        # Get data from Airlines Procedures File (Section 6.5)
-        # 'CD', 25X, 2(I3, 1X), I2, 10X, 2(Ix, 1X), I2, 2X, I2, 2(1X, I3) - procedures specification block - 3 dataline
-        APF = np.genfromtxt(Path(__file__).parent.parent.parent.parent.resolve().joinpath('./data/performance/BADA/', file_name+'.APF'), delimiter=[
-                            6, 8, 9, 4, 4, 4, 3, 5, 4, 4, 4, 4, 3, 4, 4, 5, 4, 4, 4, 5, 7], dtype="U2,U7,U7,U2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,U6", comments="CC", autostrip=True)
-
-        self.__n_eng = np.append(self.__n_eng, OPF_Actype.item()[2])
-        self.__engine_type = np.append(self.__engine_type, {
-                                       'Jet': 1, 'Turboprop': 2, 'Piston': 3}.get(OPF_Actype.item()[4]))
-        self.__wake_category = np.append(
-            self.__wake_category, OPF_Actype.item()[5])
-        self.__m_ref = np.append(self.__m_ref, OPF[0][3])
-        self.m_min = np.append(self.m_min, OPF[0][4])
-        self.__m_max = np.append(self.__m_max, OPF[0][5])
-        self.__m_pyld = np.append(self.__m_pyld, OPF[0][6])
-        self.v_mo = np.append(self.v_mo, OPF[1][3])
-        self.m_mo = np.append(self.m_mo, OPF[1][4])
-        self.__h_mo = np.append(self.__h_mo, OPF[1][5])
-        self.__h_max = np.append(self.__h_max, OPF[1][6])
-        self.__g_w = np.append(self.__g_w, OPF[0][7])
-        self.__g_t = np.append(self.__g_t, OPF[1][7])
-        self.__S = np.append(self.__S, OPF[2][3])
-        self.__c_d0_cr = np.append(self.__c_d0_cr, OPF[3][5])
-        self.__c_d2_cr = np.append(self.__c_d2_cr, OPF[3][6])
-        self.__c_d0_ap = np.append(self.__c_d0_ap, OPF[6][5])
-        self.__c_d2_ap = np.append(self.__c_d2_ap, OPF[6][6])
-        self.__c_d0_ld = np.append(self.__c_d0_ld, OPF[7][5])
-        self.__c_d2_ld = np.append(self.__c_d2_ld, OPF[7][6])
-        self.__c_d0_ldg = np.append(self.__c_d0_ldg, OPF[11][5])
-        self.__v_stall_to = np.append(self.__v_stall_to, OPF[5][4])
-        self.__v_stall_ic = np.append(self.__v_stall_ic, OPF[4][4])
-        self.__v_stall_cr = np.append(self.__v_stall_cr, OPF[3][4])
-        self.__v_stall_ap = np.append(self.__v_stall_ap, OPF[6][4])
-        self.__v_stall_ld = np.append(self.__v_stall_ld, OPF[7][4])
-        self.__c_lbo = np.append(self.__c_lbo, OPF[2][4])
-        self.__k = np.append(self.__k, OPF[2][5])
-        self.__c_tc_1 = np.append(self.__c_tc_1, OPF[14][3])
-        self.__c_tc_2 = np.append(self.__c_tc_2, OPF[14][4])
-        self.__c_tc_3 = np.append(self.__c_tc_3, OPF[14][5])
-        self.__c_tc_4 = np.append(self.__c_tc_4, OPF[14][6])
-        self.__c_tc_5 = np.append(self.__c_tc_5, OPF[14][7])
-        self.__c_tdes_low = np.append(self.__c_tdes_low, OPF[15][3])
-        self.__c_tdes_high = np.append(self.__c_tdes_high, OPF[15][4])
-        self.__h_p_des = np.append(self.__h_p_des, OPF[15][5])
-        self.__c_tdes_app = np.append(self.__c_tdes_app, OPF[15][6])
-        self.__c_tdes_ld = np.append(self.__c_tdes_ld, OPF[15][7])
-        self.__v_des_ref = np.append(self.__v_des_ref, OPF[16][3])
-        self.__m_des_ref = np.append(self.__m_des_ref, OPF[16][4])
-        self.__c_f1 = np.append(self.__c_f1, OPF[17][3])
-        self.__c_f2 = np.append(self.__c_f2, OPF[17][4])
-        self.__c_f3 = np.append(self.__c_f3, OPF[18][3])
-        self.__c_f4 = np.append(self.__c_f4, OPF[18][4])
-        self.__c_fcr = np.append(self.__c_fcr, OPF[19][3])
-        self.__tol = np.append(self.__tol, OPF[20][3])
-        self.__ldl = np.append(self.__ldl, OPF[20][4])
-        self.__span = np.append(self.__span, OPF[20][5])
-        self.__length = np.append(self.__length, OPF[20][6])
-        self.__v_cl_1 = np.append(self.__v_cl_1, APF[mass_class][4])
-        self.__v_cl_2 = np.append(self.__v_cl_2, APF[mass_class][5])
-        self.__m_cl = np.append(self.__m_cl, APF[mass_class][6]/100)
-        self.__v_cr_1 = np.append(self.__v_cr_1, APF[mass_class][9])
-        self.__v_cr_2 = np.append(self.__v_cr_2, APF[mass_class][10])
-        self.__m_cr = np.append(self.__m_cr, APF[mass_class][11]/100)
-        self.__v_des_1 = np.append(self.__v_des_1, APF[mass_class][14])
-        self.__v_des_2 = np.append(self.__v_des_2, APF[mass_class][13])
-        self.__m_des = np.append(self.__m_des, APF[mass_class][12]/100)
-        self.climb_schedule = np.append(
-            self.climb_schedule, [[0., 0., 0., 0., 0., 0., 0., 0.]], axis=0)
-        self.cruise_schedule = np.append(
-            self.cruise_schedule, [[0., 0., 0., 0., 0.]], axis=0)
-        self.descent_schedule = np.append(
-            self.descent_schedule, [[0., 0., 0., 0., 0., 0., 0., 0.]], axis=0)
-
-        # Delete variable to free memory
-        del APF
-        del OPF_Actype
-        del OPF
+        Parameters
+        ----------
+        n: int
+            Index of the reserved slot
+
+        file_name: string
+            File name of the aircraft type
+
+        mass_class: int
+            Aircraft mass for specific flight. To be used for APF. 1 = LO, 2 = AV, 3 = HI
+        """
+        # Get data from Operations Performance File (Section 6.4) and Airlines Procedures File (Section 6.5)
+        OPF, OPF_Actype = self.__load_opf(file_name)
+        APF = self.__load_apf(file_name)
+
+        self.__n_eng[n] = OPF_Actype.item()[2]
+        self.__engine_type[n] = {'Jet': 1, 'Turboprop': 2, 'Piston': 3}.get(OPF_Actype.item()[4])
+        self.__wake_category[n] = OPF_Actype.item()[5]
+        self.__m_ref[n] = OPF[0][3]
+        self.m_min[n] = OPF[0][4]
+        self.__m_max[n] = OPF[0][5]
+        self.__m_pyld[n] = OPF[0][6]
+        self.v_mo[n] = OPF[1][3]
+        self.m_mo[n] = OPF[1][4]
+        self.__h_mo[n] = OPF[1][5]
+        self.__h_max[n] = OPF[1][6]
+        self.__g_w[n] = OPF[0][7]
+        self.__g_t[n] = OPF[1][7]
+        self.__S[n] = OPF[2][3]
+        self.__c_d0_cr[n] = OPF[3][5]
+        self.__c_d2_cr[n] = OPF[3][6]
+        self.__c_d0_ap[n] = OPF[6][5]
+        self.__c_d2_ap[n] = OPF[6][6]
+        self.__c_d0_ld[n] = OPF[7][5]
+        self.__c_d2_ld[n] = OPF[7][6]
+        self.__c_d0_ldg[n] = OPF[11][5]
+        self.__v_stall_to[n] = OPF[5][4]
+        self.__v_stall_ic[n] = OPF[4][4]
+        self.__v_stall_cr[n] = OPF[3][4]
+        self.__v_stall_ap[n] = OPF[6][4]
+        self.__v_stall_ld[n] = OPF[7][4]
+        self.__c_lbo[n] = OPF[2][4]
+        self.__k[n] = OPF[2][5]
+        self.__c_tc_1[n] = OPF[14][3]
+        self.__c_tc_2[n] = OPF[14][4]
+        self.__c_tc_3[n] = OPF[14][5]
+        self.__c_tc_4[n] = OPF[14][6]
+        self.__c_tc_5[n] = OPF[14][7]
+        self.__c_tdes_low[n] = OPF[15][3]
+        self.__c_tdes_high[n] = OPF[15][4]
+        self.__h_p_des[n] = OPF[15][5]
+        self.__c_tdes_app[n] = OPF[15][6]
+        self.__c_tdes_ld[n] = OPF[15][7]
+        self.__v_des_ref[n] = OPF[16][3]
+        self.__m_des_ref[n] = OPF[16][4]
+        self.__c_f1[n] = OPF[17][3]
+        self.__c_f2[n] = OPF[17][4]
+        self.__c_f3[n] = OPF[18][3]
+        self.__c_f4[n] = OPF[18][4]
+        self.__c_fcr[n] = OPF[19][3]
+        self.__tol[n] = OPF[20][3]
+        self.__ldl[n] = OPF[20][4]
+        self.__span[n] = OPF[20][5]
+        self.__length[n] = OPF[20][6]
+        self.__v_cl_1[n] = APF[mass_class][4]
+        self.__v_cl_2[n] = APF[mass_class][5]
+        self.__m_cl[n] = APF[mass_class][6]/100
+        self.__v_cr_1[n] = APF[mass_class][9]
+        self.__v_cr_2[n] = APF[mass_class][10]
+        self.__m_cr[n] = APF[mass_class][11]/100
+        self.__v_des_1[n] = APF[mass_class][14]
+        self.__v_des_2[n] = APF[mass_class][13]
+        self.__m_des[n] = APF[mass_class][12]/100
+
+        # Derived constants used every timestep
+        self.__v_min[n] = [self.__C_V_MIN * OPF[3][4],                   # Default (clean)
+                           self.__C_V_MIN_TO * OPF[5][4],                # Takeoff
+                           self.__C_V_MIN * OPF[4][4],                   # Initial climb
+                           self.__C_V_MIN * OPF[3][4],                   # Clean
+                           self.__C_V_MIN * OPF[6][4],                   # Approach
+                           self.__C_V_MIN * OPF[7][4]]                   # Landing
+        self.__c_d0_ld_total[n] = OPF[7][5] + OPF[11][5]
+        self.__c_red[n] = np.select([self.__engine_type[n] == EngineType.TURBOPROP, self.__engine_type[n] == EngineType.PISTON, self.__engine_type[n] == EngineType.JET],
+                                    [self.__C_RED_TURBO, self.__C_RED_PISTON, self.__C_RED_JET])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.__inv_c_tc_2[n] = 1.0 / OPF[14][4]
+            self.__inv_c_f2[n] = 1.0 / OPF[17][4]
+            self.__inv_c_f4[n] = 1.0 / OPF[18][4]
+            c_lbo_k = OPF[2][4] / OPF[2][5]
+            self.__Q_lbo[n] = -np.square(-c_lbo_k)/9.0
+            self.__c_lbo_k_cube[n] = -c_lbo_k*c_lbo_k*c_lbo_k
+            self.__c_lbo_k_3[n] = c_lbo_k/3.0
+        self.climb_schedule[n] = 0.0
+        self.cruise_schedule[n] = 0.0
+        self.descent_schedule[n] = 0.0
 
     def del_aircraft(self, index):
         """
-        Delete one specific aircraft performance data to the performance array according to index. This is done by setting all parameters to 0 for reuse in future.
+        Delete one specific aircraft performance data to the performance array according to index. This is done by shifting the following rows in place so that the storage can be reused in future.
 
         Parameters
         ----------
@@ -461,69 +732,353 @@ class Bada:
         index: int
             Index of array.
         """
-        self.__n_eng = np.delete(self.__n_eng, index)
-        self.__engine_type = np.delete(self.__engine_type, index)
-        self.__wake_category = np.delete(self.__wake_category, index)
-        self.__m_ref = np.delete(self.__m_ref, index)
-        self.m_min = np.delete(self.m_min, index)
-        self.__m_max = np.delete(self.__m_max, index)
-        self.__m_pyld = np.delete(self.__m_pyld, index)
-        self.v_mo = np.delete(self.v_mo, index)
-        self.m_mo = np.delete(self.m_mo, index)
-        self.__h_mo = np.delete(self.__h_mo, index)
-        self.__h_max = np.delete(self.__h_max, index)
-        self.__g_w = np.delete(self.__g_w, index)
-        self.__g_t = np.delete(self.__g_t, index)
-        self.__S = np.delete(self.__S, index)
-        self.__c_d0_cr = np.delete(self.__c_d0_cr, index)
-        self.__c_d2_cr = np.delete(self.__c_d2_cr, index)
-        self.__c_d0_ap = np.delete(self.__c_d0_ap, index)
-        self.__c_d2_ap = np.delete(self.__c_d2_ap, index)
-        self.__c_d0_ld = np.delete(self.__c_d0_ld, index)
-        self.__c_d2_ld = np.delete(self.__c_d2_ld, index)
-        self.__c_d0_ldg = np.delete(self.__c_d0_ldg, index)
-        self.__v_stall_to = np.delete(self.__v_stall_to, index)
-        self.__v_stall_ic = np.delete(self.__v_stall_ic, index)
-        self.__v_stall_cr = np.delete(self.__v_stall_cr, index)
-        self.__v_stall_ap = np.delete(self.__v_stall_ap, index)
-        self.__v_stall_ld = np.delete(self.__v_stall_ld, index)
-        self.__c_lbo = np.delete(self.__c_lbo, index)
-        self.__k = np.delete(self.__k, index)
-        self.__c_tc_1 = np.delete(self.__c_tc_1, index)
-        self.__c_tc_2 = np.delete(self.__c_tc_2, index)
-        self.__c_tc_3 = np.delete(self.__c_tc_3, index)
-        self.__c_tc_4 = np.delete(self.__c_tc_4, index)
-        self.__c_tc_5 = np.delete(self.__c_tc_5, index)
-        self.__c_tdes_low = np.delete(self.__c_tdes_low, index)
-        self.__c_tdes_high = np.delete(self.__c_tdes_high, index)
-        self.__h_p_des = np.delete(self.__h_p_des, index)
-        self.__c_tdes_app = np.delete(self.__c_tdes_app, index)
-        self.__c_tdes_ld = np.delete(self.__c_tdes_ld, index)
-        self.__v_des_ref = np.delete(self.__v_des_ref, index)
-        self.__m_des_ref = np.delete(self.__m_des_ref, index)
-        self.__c_f1 = np.delete(self.__c_f1, index)
-        self.__c_f2 = np.delete(self.__c_f2, index)
-        self.__c_f3 = np.delete(self.__c_f3, index)
-        self.__c_f4 = np.delete(self.__c_f4, index)
-        self.__c_fcr = np.delete(self.__c_fcr, index)
-        self.__tol = np.delete(self.__tol, index)
-        self.__ldl = np.delete(self.__ldl, index)
-        self.__span = np.delete(self.__span, index)
-        self.__length = np.delete(self.__length, index)
-        self.__v_cl_1 = np.delete(self.__v_cl_1, index)
-        self.__v_cl_2 = np.delete(self.__v_cl_2, index)
-        self.__m_cl = np.delete(self.__m_cl, index)
-        self.__v_cr_1 = np.delete(self.__v_cr_1, index)
-        self.__v_cr_2 = np.delete(self.__v_cr_2, index)
-        self.__m_cr = np.delete(self.__m_cr, index)
-        self.__v_des_1 = np.delete(self.__v_des_1, index)
-        self.__v_des_2 = np.delete(self.__v_des_2, index)
-        self.__m_des = np.delete(self.__m_des, index)
-        self.climb_schedule = np.delete(self.climb_schedule, index, axis=0)
-        self.cruise_schedule = np.delete(self.cruise_schedule, index, axis=0)
-        self.descent_schedule = np.delete(self.descent_schedule, index, axis=0)
-
-    def cal_fuel_burn(self, flight_phase, tas, thrust, alt):
+        # Shift the following aircraft forward in place to keep the same order as Traffic
+        self.__params[:, index:self.__n-1] = self.__params[:, index+1:self.__n]
+        for buffer in self.__buffer.values():
+            buffer[index:self.__n-1] = buffer[index+1:self.__n]
+        self.__n -= 1
+        self.__update_view()
+
+    def del_aircraft_batch(self, index):
+        """
+        Delete multiple aircraft performance data from the performance array at once. The remaining aircraft are compacted in place with one copy per storage array, keeping the same order as Traffic.
+
+        Parameters
+        ----------
+        index: int[] or bool[]
+            Indices of the aircraft, or mask over the aircraft, to delete.
+        """
+        keep = np.ones(self.__n, dtype=bool)
+        keep[index] = False
+        n = np.count_nonzero(keep)
+        self.__params[:, :n] = self.__params[:, :self.__n][:, keep]
+        for buffer in self.__buffer.values():
+            buffer[:n] = buffer[:self.__n][keep]
+        self.__n = n
+        self.__update_view()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __load_gpf():
+        """
+        Get Global Aircraft Parameters (Section 5)
+
+        Returns
+        -------
+        GPF: GlobalParameters
+            Global aircraft parameters
+        """
+        GPF = Bada.__load_tables()['BADA.GPF']
+        return GlobalParameters._make(GPF['f5'][:len(GlobalParameters._fields)])
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __load_synonym():
+        """
+        Get SYNONYM file data and its aircraft code index (Section 6.3)
+
+        Returns
+        -------
+        SYNONYM: structured ndarray
+            Data lines of the SYNONYM file
+
+        SYNONYM_INDEX: dict
+            Row index of each aircraft code in SYNONYM.NEW (first match)
+        """
+        SYNONYM = Bada.__load_tables()['SYNONYM.NEW']
+        SYNONYM_INDEX = {}
+        for i, accode in enumerate(SYNONYM['ACCODE']):
+            SYNONYM_INDEX.setdefault(accode, i)
+        return SYNONYM, SYNONYM_INDEX
+
+    @staticmethod
+    def __load_opf(file_name):
+        """
+        Get Operations Performance File data of an aircraft type (Section 6.4)
+
+        Parameters
+        ----------
+        file_name: str
+            File name of the aircraft type in SYNONYM.NEW
+
+        Returns
+        -------
+        OPF: structured ndarray
+            Data lines of the OPF file
+
+        OPF_Actype: structured ndarray
+            Aircraft type block of the OPF file
+        """
+        tables = Bada.__load_tables()
+        return tables[file_name+'.OPF'], tables[file_name+'.OPF.ACTYPE']
+
+    @staticmethod
+    def __load_apf(file_name):
+        """
+        Get Airlines Procedures File data of an aircraft type (Section 6.5)
+
+        Parameters
+        ----------
+        file_name: str
+            File name of the aircraft type in SYNONYM.NEW
+
+        Returns
+        -------
+        APF: structured ndarray
+            Procedures specification block of the APF file
+        """
+        return Bada.__load_tables()[file_name+'.APF']
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __load_tables():
+        """
+        Load all parsed BADA tables from the binary cache (_cache.npz) of the data directory. The cache is rebuilt from the text files when its list of source files (name, size and modification time) does not match the data directory.
+
+        Returns
+        -------
+        tables: dict
+            Parsed tables {file name: structured ndarray}, with the OPF aircraft type block under '<file name>.ACTYPE'
+        """
+        cache_path = Bada.__DATA_PATH.joinpath('_cache.npz')
+        paths = sorted(path for path in Bada.__DATA_PATH.glob('*')
+                       if path.suffix in ('.OPF', '.APF') or path.name in ('BADA.GPF', 'SYNONYM.NEW'))
+        # Source files the cache was built from, so copied files with older timestamps are also detected
+        sources = np.array([f"{path.name}:{path.stat().st_size}:{path.stat().st_mtime_ns}" for path in paths])
+
+        if cache_path.is_file():
+            try:
+                with np.load(cache_path) as cache:
+                    if '_SOURCES' in cache and np.array_equal(cache['_SOURCES'], sources):
+                        tables = dict(cache)
+                        del tables['_SOURCES']
+                        return tables
+            except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+                # Truncated or corrupted cache, rebuilt from the text files below
+                pass
+
+        tables = {}
+        for path in paths:
+            if path.suffix == '.OPF':
+                tables[path.name], tables[path.name+'.ACTYPE'] = Bada.__parse_opf(path.name)
+            elif path.suffix == '.APF':
+                tables[path.name] = Bada.__parse_apf(path.name)
+            elif path.name == 'BADA.GPF':
+                tables[path.name] = Bada.__parse_gpf(path.name)
+            else:
+                tables[path.name] = Bada.__parse_synonym(path.name)
+
+        # Write to a temporary file and swap it in, so an interrupted or concurrent run never leaves a partial cache
+        temp_path = cache_path.with_name(f'_cache.{os.getpid()}.tmp')
+        try:
+            with open(temp_path, 'wb') as file:
+                np.savez_compressed(file, _SOURCES=sources, **tables)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # Data directory is not writable, the text files are parsed on every run
+            temp_path.unlink(missing_ok=True)
+        return tables
+
+    @staticmethod
+    def __parse_gpf(file_name):
+        """
+        Parse Global Aircraft Parameters File (Section 6.8)
+
+        Parameters
+        ----------
+        file_name: str
+            Name of the GPF file
+
+        Returns
+        -------
+        GPF: structured ndarray
+            Data lines of the GPF file
+        """
+        # 'CD', 1X, A15, 1X, A7, 1X, A16, 1x, A29, 1X, E10.5
+        return Bada.__read_fixed_width(Bada.__read_lines(file_name),
+                                       widths=[3, 16, 8, 17, 29, 12], dtype="U2,U15,U7,U16,U29,f8", skip_footer=1)
+
+    @staticmethod
+    def __parse_synonym(file_name):
+        """
+        Parse SYNONYM file (Section 6.3)
+
+        Parameters
+        ----------
+        file_name: str
+            Name of the SYNONYM file
+
+        Returns
+        -------
+        SYNONYM: structured ndarray
+            Data lines of the SYNONYM file
+        """
+        return Bada.__read_fixed_width(Bada.__read_lines(file_name, encoding='unicode_escape'), widths=[3, 2, 7, 20, 25, 8, 5], names=[
+                                       'CD', 'ST', 'ACCODE', 'MANUFACTURER', 'MODEL', 'FILENAME', 'ICAO'], dtype="U2,U1,U4,U18,U25,U6,U1", skip_footer=1)
+
+    @staticmethod
+    def __parse_opf(file_name):
+        """
+        Parse Operations Performance File (Section 6.4)
+
+        Parameters
+        ----------
+        file_name: str
+            Name of the OPF file
+
+        Returns
+        -------
+        OPF: structured ndarray
+            Data lines of the OPF file
+
+        OPF_Actype: structured ndarray
+            Aircraft type block of the OPF file
+        """
+        # Both blocks are parsed from one read of the file
+        lines = Bada.__read_lines(file_name)
+
+        # Get data from Operations Performance File (Section 6.4)
+        OPF = Bada.__read_fixed_width(lines, widths=[3, 2, 2, 13, 13, 13, 13, 11],
+                                      dtype="U2,U1,U2,f8,f8,f8,f8,f8", skip_header=16, skip_footer=1)
+
+        # 'CD', 3X, A6, 9X, I1, 12X, A9, 17X, A1 - aircraft type block - 1 data line
+        # | 'CD' | ICAO | # of engine | 'engines' | engine type ( Jet,  Turboprop  or  Piston) | wake category ( J (jumbo), H (heavy), M (medium) or L (light))
+        OPF_Actype = Bada.__read_fixed_width(lines, widths=[5, 15, 1, 12, 26, 1], dtype="U2,U6,i1,U7,U9,U1", max_rows=1)
+
+        return OPF, OPF_Actype
+
+    @staticmethod
+    def __parse_apf(file_name):
+        """
+        Parse Airlines Procedures File (Section 6.5)
+
+        Parameters
+        ----------
+        file_name: str
+            Name of the APF file
+
+        Returns
+        -------
+        APF: structured ndarray
+            Procedures specification block of the APF file
+        """
+        # 'CD', 25X, 2(I3, 1X), I2, 10X, 2(Ix, 1X), I2, 2X, I2, 2(1X, I3) - procedures specification block - 3 dataline
+        return Bada.__read_fixed_width(Bada.__read_lines(file_name), widths=[6, 8, 9, 4, 4, 4, 3, 5, 4, 4, 4, 4, 3, 4, 4, 5, 4, 4, 4, 5, 7],
+                                       dtype="U2,U7,U7,U2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,i2,U6")
+
+    @staticmethod
+    def __read_lines(file_name, encoding="latin-1"):
+        """
+        Read all lines of a file in the BADA data directory
+
+        Parameters
+        ----------
+        file_name: str
+            Name of the BADA file
+
+        encoding: str
+            Encoding of the file
+
+        Returns
+        -------
+        lines: str[]
+            Lines of the file
+        """
+        return Bada.__DATA_PATH.joinpath(file_name).read_text(encoding=encoding).splitlines()
+
+    @staticmethod
+    def __read_fixed_width(lines, widths, dtype, names=None, skip_header=0, skip_footer=0, max_rows=None):
+        """
+        Read BADA fixed-width data lines (replacement of np.genfromtxt with comments="CC" and autostrip=True)
+
+        Parameters
+        ----------
+        lines: str[]
+            Lines of the BADA file (obtained from __read_lines())
+
+        widths: int[]
+            Width of each field [characters]
+
+        dtype: str
+            Comma separated data type of each field
+
+        names: str[]
+            Name of each field
+
+        skip_header: int
+            Number of lines to skip at the beginning of the file
+
+        skip_footer: int
+            Number of data lines to skip at the end of the file
+
+        max_rows: int
+            Maximum number of data lines to read
+
+        Returns
+        -------
+        data: structured ndarray
+            Data lines of the file
+        """
+        dtype = np.dtype(dtype)
+        if names is not None:
+            dtype.names = names
+        # Missing values are filled as np.genfromtxt does (nan for float and -1 for integer)
+        converters = [(lambda x: float(x) if x else np.nan) if dtype[i].kind == 'f' else
+                      (lambda x: int(x) if x else -1) if dtype[i].kind == 'i' else str for i in range(len(dtype))]
+        bounds = [sum(widths[:i]) for i in range(len(widths)+1)]
+
+        rows = []
+        for line in lines[skip_header:]:
+            # Text after 'CC' is comment
+            line = line.split("CC")[0]
+            # Blank lines are skipped as np.genfromtxt does
+            if not line.strip():
+                continue
+            rows.append([line[start:end].strip()
+                         for start, end in zip(bounds[:-1], bounds[1:])])
+            if len(rows) == max_rows:
+                break
+
+        return np.array([tuple(convert(field) for convert, field in zip(converters, row))
+                         for row in rows[:len(rows)-skip_footer]], dtype=dtype)
+
+    def __alloc_slots(self, count):
+        """
+        Reserve the next aircraft of the performance array, growing the storage when it is full.
+
+        Parameters
+        ----------
+        count: int
+            Number of aircraft to reserve
+
+        Returns
+        -------
+        slots: int[]
+            Indices of the new aircraft
+        """
+        if self.__n + count > self.__capacity:
+            self.__capacity = max(2 * self.__capacity, self.__n + count)
+            params = self.__params
+            self.__params = np.zeros((params.shape[0], self.__capacity), dtype=params.dtype)
+            self.__params[:, :self.__n] = params[:, :self.__n]
+            for name, buffer in self.__buffer.items():
+                self.__buffer[name] = np.zeros(
+                    (self.__capacity,) + buffer.shape[1:], dtype=buffer.dtype)
+                self.__buffer[name][:self.__n] = buffer[:self.__n]
+        self.__n += count
+        self.__update_view()
+        return np.arange(self.__n - count, self.__n)
+
+    def __update_view(self):
+        """
+        Point the per-aircraft arrays to the first n aircraft of the storage.
+        """
+        for name, i in self.__IDX.items():
+            setattr(self, name, self.__params[i, :self.__n])
+        for name, buffer in self.__buffer.items():
+            setattr(self, name, buffer[:self.__n])
+
+    def cal_fuel_burn(self, flight_phase, tas, thrust, alt, out=None):
         """
         Calculate fuel burn
 
@@ -537,37 +1092,24 @@ class Bada:
             Thrust [N]
         alt : _type_
             Altitude [ft]
+        out : float[], optional
+            Preallocated array to write the fuel burn to
 
         Returns
         -------
         Fuel burn : float[]
-            Fuel burn [kg/s]
+            Fuel burn [kg/s] (out if given)
 
         TODO: Thrust mode -> idle descent
         """
-        a = self.__cal_nominal_fuel_flow(tas, thrust)/60.0
-        return np.select(
-            condlist=[
-                flight_phase == FlightPhase.CRUISE,
-                flight_phase == FlightPhase.DESCENT,
-                flight_phase == FlightPhase.APPROACH,
-                flight_phase == FlightPhase.LANDING
-            ],
-            choicelist=[
-                self.__cal_cruise_fuel_flow(
-                    tas, thrust)/60000.0,                      # cruise
-                # Idle descent
-                self.__cal_minimum_fuel_flow(alt)/60000.0,
-                self.__cal_approach_landing_fuel_flow(
-                    tas, thrust, alt)/60000.0,       # Approach
-                self.__cal_approach_landing_fuel_flow(
-                    tas, thrust, alt/60000.0)        # Landing
-            ],
-            default=self.__cal_nominal_fuel_flow(
-                tas, thrust)/60000.0                      # Others
-        )
-
-    def cal_thrust(self, vertical_mode, configuration, H_p, V_tas, d_T, drag, ap_speed_mode):
+        flight_phase, tas, thrust, alt = broadcast_1d(flight_phase, tas, thrust, alt, length=self.__n)
+        fuel_burn = np.empty(self.__n) if out is None else out
+        # Fuel flow of each aircraft in its flight phase [kg/min -> kg/s]
+        self.__cal_fuel_flow(flight_phase, tas, thrust, alt, fuel_burn)
+        fuel_burn /= 60000.0
+        return fuel_burn
+
+    def cal_thrust(self, vertical_mode, configuration, H_p, V_tas, d_T, drag, ap_speed_mode, out=None):
         """
         Calculate thrust given flight phases.
 
@@ -594,24 +1136,27 @@ class Bada:
         ap_speed_mode : AP_speed_mode enum []
             Autopilot speed mode [1: Constant CAS, 2: Constant Mach, 3: Acceleration, 4: Deceleration]
 
+        out : float[], optional
+            Preallocated array to write the thrust to
+
         Returns
         -------
-        _type_
-            _description_
-        """
-        return np.select(
-            condlist=[
-                        (vertical_mode == VerticalMode.CLIMB) | (
-                            (vertical_mode == VerticalMode.LEVEL) & (ap_speed_mode == APSpeedMode.ACCELERATE)),
-                        (vertical_mode == VerticalMode.LEVEL) & ((ap_speed_mode == APSpeedMode.CONSTANT_CAS) | (
-                            ap_speed_mode == APSpeedMode.CONSTANT_MACH)),
-                        (vertical_mode == VerticalMode.DESCENT) | ((vertical_mode == VerticalMode.LEVEL) & (ap_speed_mode == APSpeedMode.DECELERATE))],
-            choicelist=[
-                self.__cal_max_climb_to_thrust(H_p, V_tas, d_T),
-                # max climb thrust when acceleration, T = D at cruise, but limited at max cruise thrust
-                np.minimum(drag, self.__cal_max_cruise_thrust(
-                    self.__cal_max_climb_to_thrust(H_p, V_tas, d_T))),
-                self.__cal_descent_thrust(H_p, self.__cal_max_climb_to_thrust(H_p, V_tas, d_T), configuration)])
+        thrust: float[]
+            Thrust [N] (out if given)
+        """
+        vertical_mode, configuration, H_p, V_tas, d_T, drag, ap_speed_mode = broadcast_1d(
+            vertical_mode, configuration, H_p, V_tas, d_T, drag, ap_speed_mode, length=self.__n)
+        climb = (vertical_mode == VerticalMode.CLIMB) | (
+            (vertical_mode == VerticalMode.LEVEL) & (ap_speed_mode == APSpeedMode.ACCELERATE))
+        cruise = (vertical_mode == VerticalMode.LEVEL) & (
+            (ap_speed_mode == APSpeedMode.CONSTANT_CAS) | (ap_speed_mode == APSpeedMode.CONSTANT_MACH))
+        descent = (vertical_mode == VerticalMode.DESCENT) | (
+            (vertical_mode == VerticalMode.LEVEL) & (ap_speed_mode == APSpeedMode.DECELERATE))
+
+        # max climb thrust when acceleration, T = D at cruise, but limited at max cruise thrust
+        if out is None:
+            out = np.empty(len(H_p))
+        return self.__cal_engine_thrust(climb, cruise, descent, H_p, V_tas, d_T, drag, configuration, out)
 
     # -----------------------------------------------------------------------------------------------------
     # ----------------------------- BADA Implementation----------------------------------------------------
@@ -657,11 +1202,13 @@ class Bada:
         h_max/act: float[]
             Actual maximum altitude for any given mass [ft]
         """
-        return np.where(self.__h_max == 0,
-                        # If h_max in OPF file is zero, maximum altitude is always h_MO
-                        self.__h_mo,
-                        # Else Equation 3.5-1
-                        np.minimum(self.__h_mo, self.__h_max + self.__g_t*(d_T-self.__c_tc_4) + self.__g_w*(self.__m_max-m)))
+        d_T, m = broadcast_1d(d_T, m, length=self.__n)
+        # If h_max in OPF file is zero, maximum altitude is always h_MO
+        h_max_act = self.__h_mo.astype(float)
+        # Else Equation 3.5-1, evaluated only for the aircraft with non-zero h_max
+        i = np.flatnonzero(self.__h_max)
+        h_max_act[i] = np.minimum(self.__h_mo[i], self.__h_max[i] + self.__g_t[i]*(d_T[i]-self.__c_tc_4[i]) + self.__g_w[i]*(self.__m_max[i]-m[i]))
+        return h_max_act
 
     def cal_minimum_speed(self, configuration):
         """
@@ -677,22 +1224,11 @@ class Bada:
         v_min: float[]
             Minimum at speed at specific configuration [knots] TODO: need to consider mass using __calculate_operating_speed?
         """
-
-        return np.select(condlist=[configuration == Config.TAKEOFF,
-                                   configuration == Config.INITIAL_CLIMB,
-                                   configuration == Config.APPROACH,
-                                   configuration == Config.LANDING],
-
-                         choicelist=[self.__C_V_MIN_TO * self.__v_stall_to,
-                                     self.__C_V_MIN * self.__v_stall_ic,
-                                     self.__C_V_MIN * self.__v_stall_ap,
-                                     self.__C_V_MIN * self.__v_stall_ld],
-
-                         default=self.__C_V_MIN * self.__v_stall_cr)
+        return self.__v_min[np.arange(len(self.__v_min)), np.asarray(configuration, dtype=np.intp)]
 
     # ----------------------------  Aerodynamic section 3.6 -----------------------------------------
 
-    def cal_aerodynamic_drag(self, V_tas, bank_angle, m, rho, configuration, c_des_exp):
+    def cal_aerodynamic_drag(self, V_tas, bank_angle, m, rho, configuration, c_des_exp, out=None):
         """
         Calculate Aerodynamic drag (Section 3.6.1)
 
@@ -716,39 +1252,19 @@ class Bada:
         c_des_exp: float[]
             Coefficient of expedited descent factor [dimensionless]
 
+        out : float[], optional
+            Preallocated array to write the drag to
+
         Returns
         -------
         D: float[]
-            Drag force [N]
+            Drag force [N] (out if given)
         """
-        # Lift coefficient (Equation 3.6-1)
-        c_L = 2.0 * m * self.__G_0 / rho / \
-            np.square(V_tas) / self.__S / np.cos(np.deg2rad(bank_angle))
-
-        # Drag coefficient (Equation3.6-2~4)
-        c_D = np.select(condlist=[
-            configuration == Config.APPROACH,
-            configuration == Config.LANDING
-        ],
-            choicelist=[
-            np.where(self.__c_d2_ap != 0,                                               # Approach config
-                     # If c_d0_ap / c_d2_ap are NOT set to 0 (Equation 3.6-3)
-                     self.__c_d0_ap + self.__c_d2_ap * \
-                     np.square(c_L),
-                     self.__c_d0_cr + self.__c_d2_cr * np.square(c_L)),                          # If c_d0_ap / c_d2_ap are  set to 0 (Equation 3.6-2)
-            np.where(self.__c_d2_ld != 0,                                               # Landing config
-                     # If c_d0_ld / c_d2_ld are NOT set to 0 (Equation 3.6-4)
-                     self.__c_d0_ld + self.__c_d0_ldg + \
-                     self.__c_d2_ld * np.square(c_L),
-                     self.__c_d0_cr + self.__c_d2_cr * np.square(c_L))                           # If c_d0_ld / c_d2_ld are set to 0 (Equation 3.6-2)
-        ],
-            # All configs except for approach and landing. (Equation 3.6-2)
-            default=self.__c_d0_cr + \
-            self.__c_d2_cr * np.square(c_L),
-        )
-
-        # Drag force
-        return np.where(V_tas == 0.0, 0.0, c_D * rho * np.square(V_tas) * self.__S / 2.0 * c_des_exp)
+        V_tas, bank_angle, m, rho, configuration, c_des_exp = broadcast_1d(V_tas, bank_angle, m, rho, configuration, c_des_exp, length=self.__n)
+        drag = np.empty(self.__n) if out is None else out
+        _cal_aerodynamic_drag(self.__c_d0_cr, self.__c_d2_cr, self.__c_d0_ap, self.__c_d2_ap, self.__c_d0_ld_total, self.__c_d2_ld, self.__S, self.__G_0,
+                              V_tas, bank_angle, m, rho, configuration, c_des_exp, drag)
+        return drag
 
     def cal_low_speed_buffeting_limit(self, p, M, m):
         """
@@ -776,111 +1292,67 @@ class Bada:
         TODO: Calculate minimum speed for Jet and Turboprop when H_p >= 15000. V_min = MAX(V_min_stall, M_b) (<- same unit)
               If H_p < 15000, V_min = V_min_stall
         """
-        Q = (-np.square(-self.__c_lbo/self.__k)/9.0)
+        Q = self.__Q_lbo
         R = (-27.0*(m*self.__G_0/self.__S)/0.583/p/self.__k -
-             2.0*np.power(-self.__c_lbo/self.__k, 3)) / 54.0
-        theta = np.arccos(R/np.sqrt(-np.power(Q, 3)))
+             2.0*self.__c_lbo_k_cube) / 54.0
+        theta = np.arccos(R/np.sqrt(-Q*Q*Q))      # [rad]
 
-        X_1 = 2.0 * np.sqrt(-Q) * np.cos(np.deg2rad(theta/3)
-                                         ) + (self.__c_lbo/self.__k)/3.0
-        X_2 = 2.0 * np.sqrt(-Q) * np.cos(np.deg2rad(theta /
-                                                    3 + 120)) + (self.__c_lbo/self.__k)/3.0
-        X_3 = 2.0 * np.sqrt(-Q) * np.cos(np.deg2rad(theta /
-                                                    3 + 240)) + (self.__c_lbo/self.__k)/3.0
+        X_1 = 2.0 * np.sqrt(-Q) * np.cos(theta/3) + self.__c_lbo_k_3
+        X_2 = 2.0 * np.sqrt(-Q) * np.cos(theta/3 + 2.0*np.pi/3.0) + self.__c_lbo_k_3
+        X_3 = 2.0 * np.sqrt(-Q) * np.cos(theta/3 + 4.0*np.pi/3.0) + self.__c_lbo_k_3
 
         arr = np.array([X_1, X_2, X_3])
-        return np.max(np.where(arr <= 0, np.inf, arr), axis=0)
+        # Lowest positive root
+        return np.min(np.where(arr <= 0, np.inf, arr), axis=0)
 
     # ----------------------------  Engine Thrust section 3.7 -----------------------------------------
 
-    def __cal_max_climb_to_thrust(self, H_p, V_tas, d_T):
+    def __cal_engine_thrust(self, climb, cruise, descent, H_p, V_tas, d_T, drag, configuration, thrust):
         """
-        Calculate maximum climb thrust for both take-off and climb phases (Section 3.7.1)
+        Calculate maximum climb thrust (Section 3.7.1), cruise thrust limited at maximum cruise thrust (Equation 3.7-8) and descent thrust (Section 3.7.3)
 
         Parameters
         ----------
+        climb: bool[]
+            Aircraft using maximum climb thrust
+
+        cruise: bool[]
+            Aircraft using cruise thrust
+
+        descent: bool[]
+            Aircraft using descent thrust
+
         H_p: float[]
-            Geopotential pressuer altitude [ft] TODO: Different unit
+            Geopotential pressuer altitude [ft]
 
         V_tas: float[]
-            True airspeed [kt] TODO: Different unit
+            True airspeed [kt]
 
         d_T: float[]
             Temperature differential from ISA [K]
 
-        Returns
-        -------
-        Thr_max_climb: float[]
-            Maximum climb thrust [N]
-        """
-        # Maximum climb thrust at standard atmosphere conditions (Equations 3.7-1~3)
-        thr_max_climb_isa = np.select([self.__engine_type == EngineType.JET,
-                                       self.__engine_type == EngineType.TURBOPROP,
-                                       self.__engine_type == EngineType.PISTON],
-
-                                      [self.__c_tc_1 * (1.0 - H_p/self.__c_tc_2 + self.__c_tc_3 * np.square(H_p)),
-                                       self.__c_tc_1/V_tas *
-                                       (1.0 - H_p/self.__c_tc_2) + self.__c_tc_3,
-                                       self.__c_tc_1 *
-                                       (1.0 - H_p/self.__c_tc_2) +
-                                       self.__c_tc_3/V_tas
-                                       ])
-
-        # Corrected for temperature deviation from ISA
-        return thr_max_climb_isa * (1.0 - np.clip(np.clip(self.__c_tc_5, 0.0, None) * (d_T-self.__c_tc_4), 0.0, 0.4))
+        drag: float[]
+            Drag forces [N]
 
-    def __cal_max_cruise_thrust(self, Thr_max_climb):
-        """
-        Calculate maximum cruise thrust (Equation 3.7-8)
+        configuration: float[]
+            Configuration from Traffic class [Configuration enum]
 
-        Parameters
-        ----------
-        Thr_max_climb: float[]
-            Maximum climb thrust [N] (obtained from cal_max_climb_to_thrust())
+        thrust: float[]
+            Array to write the thrust to
 
         Returns
         -------
-        thr_cruise_max: float[]
-            Maximum cruise thrust [N]
+        thrust: float[]
+            Thrust [N], 0 for aircraft in none of the phases
 
         Notes
         -----
         The normal cruise thrust is by definition set equal to drag (Thr=D). However, the maximum amount of thrust available in cruise situation is limited.
+        The maximum climb thrust is evaluated once per aircraft and all phases are computed in the same kernel pass.
         """
-        return self.__C_TCR * Thr_max_climb
-
-    def __cal_descent_thrust(self, H_p, Thr_max_climb, configuration):
-        """
-        Calculate descent thrust (Section 3.7.3)
-
-        Parameters
-        ----------
-        H_p: float[]
-            Geopotential pressuer altitude [m]
-
-        Thr_max_climb: float[]
-            Maximum climb thrust [N]
-
-        Configuration: float[]
-            Configuration from Traffic class [Configuration enum]
-
-        Returns
-        -------
-        Thr_des: float[]
-            Descent thrust [N]
-        """
-        # When “non-clean” data (see Section 3.6.1) is available, H_p,des cannot be below H_max,AP.
-        return np.where(H_p > np.where(self.__c_d2_ap != 0, np.clip(self.__h_p_des, self.__H_MAX_AP, None), self.__h_p_des),
-                        # If H_p > H_p_des
-                        self.__c_tdes_high * Thr_max_climb,     # Equation 3.7-9
-                        # Else
-                        np.select([configuration == Config.CLEAN,
-                                   configuration == Config.APPROACH,
-                                   configuration == Config.LANDING],
-
-                                  [self.__c_tdes_low * Thr_max_climb,       # Equation 3.7-10
-                                   self.__c_tdes_app * Thr_max_climb,       # Equation 3.7-11
-                                   self.__c_tdes_ld * Thr_max_climb]))      # Equation 3.7-12
+        return _cal_thrust(climb, cruise, descent, self.__engine_type, self.__c_tc_1, self.__inv_c_tc_2, self.__c_tc_3, self.__c_tc_4, self.__c_tc_5, self.__C_TCR,
+                           self.__c_d2_ap, self.__h_p_des, self.__c_tdes_high, self.__c_tdes_low, self.__c_tdes_app, self.__c_tdes_ld, self.__H_MAX_AP,
+                           H_p, V_tas, d_T, drag, configuration, thrust)
 
     # ----------------------------  Reduced climb power section 3.8 -----------------------------------------
 
@@ -908,119 +1380,42 @@ class Bada:
         -----
         The result can be applied in the calculation of ROCD during climb phase TODO:
         """
-        c_red = np.where(H_p < 0.8*H_max,
-                         # If (H_p < 0.8*H_max) section 5.11
-                         np.select([self.__engine_type == EngineType.TURBOPROP, self.__engine_type == EngineType.PISTON, self.__engine_type == EngineType.JET],
-                                   [self.__C_RED_TURBO, self.__C_RED_PISTON, self.__C_RED_JET]),
-                         # Else
-                         0.0)
+        # If (H_p < 0.8*H_max) section 5.11, else 0
+        c_red = np.where(H_p < 0.8*H_max, self.__c_red, 0.0)
 
         # Equation 3.8-1
         return 1.0 - c_red * (self.__m_max - m/1000.0) / (self.__m_max - self.m_min)
 
     # ----------------------------  Fuel consumption section 3.9 -----------------------------------------
 
-    def __cal_nominal_fuel_flow(self, V_tas, Thr):
-        """
-        Calculate nominal fuel flow (except idle descent and cruise) (equations 3.9-1~3 and 3.9-7)
-
-        Parameters
-        ----------
-        V_tas: float[]
-            True airspeed [kt] TODO: Different unit
-
-        Thr: float[]
-            Thrust acting parallel to the aircraft velocity vector [N]
-
-        Returns
-        -------
-        f_norm: float[]
-            Nominal fuel flow [kg/min]
-        """
-        return np.select([self.__engine_type == EngineType.JET,
-                          self.__engine_type == EngineType.TURBOPROP,
-                          self.__engine_type == EngineType.PISTON],
-
-                         [self.__c_f1 * (1.0 + V_tas/self.__c_f2) * Thr,                    # Equation 3.9-1 and 3.9-3
-                          # Equation 3.9-2 and 3.9-3
-                          self.__c_f1 * (1.0 - V_tas/self.__c_f2) * \
-                          (V_tas/1000.0) * Thr,
-                          self.__c_f1])                                                     # Equation 3.9-7
-
-    def __cal_minimum_fuel_flow(self, H_p):
+    def __cal_fuel_flow(self, flight_phase, V_tas, Thr, H_p, fuel_flow):
         """
-        Calculate fuel flow for idle descent (equations 3.9-4 and 3.9-8)
+        Calculate fuel flow of each aircraft in its flight phase: nominal (Equation 3.9-1~3 and 3.9-7), minimum for idle descent (Equation 3.9-4 and 3.9-8), approach and landing (Equation 3.9-5 and 3.9-8) and cruise (Equation 3.9-6 and 3.9-9)
 
         Parameters
         ----------
-        H_p: float[]
-            Geopotential pressuer altitude [ft] TODO: Different uni
-
-        Returns
-        -------
-        f_min: float[]
-            Minimum fuel flow [kg/min]
-        """
-        return np.where(self.__engine_type != EngineType.PISTON,
-                        # Non piston
-                        # Equation 3.9-4
-                        self.__c_f3 * (1.0 - H_p/self.__c_f4),
-                        # Piston
-                        self.__c_f3)                                # Equation 3.9-8
-
-    def __cal_approach_landing_fuel_flow(self, V_tas, Thr, H_p):
-        """
-        Calculate fuel flow for approach and landing (equations 3.9-5 and 3.9-8)
+        flight_phase: float[]
+            Flight phase from Traffic class [Flight_phase enum]
 
-        Parameters
-        ----------
         V_tas: float[]
-            True airspeed [kt] TODO: Different unit
+            True airspeed [knots]
 
         Thr: float[]
-            Thrust acting parallel to the aircraft velocity vector [N]
+            Thrust [N]
 
         H_p: float[]
-            Geopotential pressuer altitude [ft] TODO: Different uni
-
-        Returns
-        -------
-        f_app/ld: float[]
-            Approach and landing fuel flow [kg/min]
-        """
-        return np.where(self.__engine_type != EngineType.PISTON,
-                        # Non piston
-                        np.maximum(self.__cal_nominal_fuel_flow(
-                            V_tas, Thr), self.__cal_minimum_fuel_flow(H_p)),  # Equation 3.9-5
-                        # Piston
-                        self.__cal_minimum_fuel_flow(H_p))                                                          # Equation 3.9-8
-
-    def __cal_cruise_fuel_flow(self, V_tas, Thr):
-        """
-        Calculate fuel flow for cruise (equations 3.9-6 and 3.9-9)
-
-        Parameters
-        ----------
-        V_tas: float[]
-            True airspeed [kt] TODO: Different unit
+            Geopotential pressure altitude [feet]
 
-        Thr: float[]
-            Thrust acting parallel to the aircraft velocity vector [N]
+        fuel_flow: float[]
+            Array to write the fuel flow to
 
         Returns
         -------
-        f_cr: float[]
-            Cruise fuel flow [kg/min]
+        fuel_flow: float[]
+            Fuel flow [kg/min]
         """
-        return np.select([self.__engine_type == EngineType.JET,
-                          self.__engine_type == EngineType.TURBOPROP,
-                          self.__engine_type == EngineType.PISTON],
-
-                         [self.__c_f1 * (1.0 + V_tas/self.__c_f2) * Thr * self.__c_fcr,                     # Equation 3.9-6
-                          # Equation 3.9-6
-                          self.__c_f1 * (1.0 - V_tas/self.__c_f2) * \
-                          (V_tas/1000.0) * Thr * self.__c_fcr,
-                          self.__c_f1 * self.__c_fcr])                                                      # Equation 3.9-9
+        return _cal_fuel_flow(flight_phase, self.__engine_type, self.__c_f1, self.__inv_c_f2, self.__c_f3, self.__inv_c_f4, self.__c_fcr,
+                              V_tas, Thr, H_p, fuel_flow)
 
     # ----------------------------  Airline Procedure Models section 4 -----------------------------------------
 
@@ -1033,44 +1428,59 @@ class Bada:
         m: float[]
             Aircraft mass [kg]
 
-        n: int
+        n: int, int[], bool[] or slice
             Index of performance array.
         """
+        jet = (self.__engine_type[n] == EngineType.JET)[..., None]
+
         # Actual stall speed for takeoff
         v_stall_to_act = Unit.mps2kts(self.__cal_operating_speed(
             m, Unit.kts2mps(self.__v_stall_to))[n])
+        v_min_to = self.__C_V_MIN * v_stall_to_act
+        v_cl_1 = np.minimum(self.__v_cl_1[n], 250)
+        zero = np.zeros_like(v_min_to)
         # Standard climb schedule
-        if (self.__engine_type[n] == EngineType.JET):
-            # If Jet (Equation 4.1-1~5)
-            self.climb_schedule[n] = [self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_1, self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_2, self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_3,
-                                      self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_4, self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_5, np.minimum(self.__v_cl_1[n], 250), self.__v_cl_2[n], self.__m_cl[n]]
-        else:
-            # Else if turboprop and piston (Equation 4.1-6~8)
-            self.climb_schedule[n] = [self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_6, self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_7, self.__C_V_MIN * v_stall_to_act + self.__V_D_CL_8,
-                                      np.minimum(self.__v_cl_1[n], 250), self.__v_cl_2[n], self.__m_cl[n], 0.0, 0.0]
+        self.climb_schedule[n] = np.where(jet,
+                                          # If Jet (Equation 4.1-1~5)
+                                          np.stack([v_min_to + self.__V_D_CL_1, v_min_to + self.__V_D_CL_2, v_min_to + self.__V_D_CL_3,
+                                                    v_min_to + self.__V_D_CL_4, v_min_to + self.__V_D_CL_5, v_cl_1, self.__v_cl_2[n], self.__m_cl[n]], axis=-1),
+                                          # Else if turboprop and piston (Equation 4.1-6~8)
+                                          np.stack([v_min_to + self.__V_D_CL_6, v_min_to + self.__V_D_CL_7, v_min_to + self.__V_D_CL_8,
+                                                    v_cl_1, self.__v_cl_2[n], self.__m_cl[n], zero, zero], axis=-1))
 
         # Standard cruise schedule
-        if (self.__engine_type[n] == EngineType.JET):
-            # If Jet
-            self.cruise_schedule[n] = [np.minimum(self.__v_cr_1[n], 170), np.minimum(
-                self.__v_cr_1[n], 220), np.minimum(self.__v_cr_1[n], 250), self.__v_cr_2[n], self.__m_cr[n]]
-        else:
-            # Else if turboprop and piston
-            self.cruise_schedule[n] = [np.minimum(self.__v_cr_1[n], 150), np.minimum(
-                self.__v_cr_1[n], 180), np.minimum(self.__v_cr_1[n], 250), self.__v_cr_2[n], self.__m_cr[n]]
+        v_cr_1 = self.__v_cr_1[n]
+        self.cruise_schedule[n] = np.where(jet,
+                                           # If Jet
+                                           np.stack([np.minimum(v_cr_1, 170), np.minimum(v_cr_1, 220), np.minimum(
+                                               v_cr_1, 250), self.__v_cr_2[n], self.__m_cr[n]], axis=-1),
+                                           # Else if turboprop and piston
+                                           np.stack([np.minimum(v_cr_1, 150), np.minimum(v_cr_1, 180), np.minimum(
+                                               v_cr_1, 250), self.__v_cr_2[n], self.__m_cr[n]], axis=-1))
 
         # Actual stall speed for landing TODO: consider fuel mass?
         v_stall_ld_act = Unit.mps2kts(self.__cal_operating_speed(
             m, Unit.kts2mps(self.__v_stall_ld))[n])
+        v_min_ld = self.__C_V_MIN * v_stall_ld_act
         # Standard descent schedule
-        if (self.__engine_type[n] != EngineType.PISTON):
-            # If Jet and Turboprop (Equation 4.3-1~4)
-            self.descent_schedule[n] = [self.__C_V_MIN * v_stall_ld_act + self.__V_D_DSE_1, self.__C_V_MIN * v_stall_ld_act + self.__V_D_DSE_2, self.__C_V_MIN * v_stall_ld_act + self.__V_D_DSE_3,
-                                        self.__C_V_MIN * v_stall_ld_act + self.__V_D_DSE_4, np.minimum(self.__v_des_1[n], 220), np.minimum(self.__v_des_1[n], 250), self.__v_des_2[n], self.__m_des[n]]
-        else:
-            # Else if Piston (Equation 4.3-5~7)
-            self.descent_schedule[n] = [self.__C_V_MIN * v_stall_ld_act + self.__V_D_DSE_5, self.__C_V_MIN * v_stall_ld_act + self.__V_D_DSE_6, self.__C_V_MIN * v_stall_ld_act + self.__V_D_DSE_7,
-                                        self.__v_des_1[n], self.__v_des_2[n], self.__m_des[n], 0.0, 0.0]
+        self.descent_schedule[n] = np.where((self.__engine_type[n] != EngineType.PISTON)[..., None],
+                                            # If Jet and Turboprop (Equation 4.3-1~4)
+                                            np.stack([v_min_ld + self.__V_D_DSE_1, v_min_ld + self.__V_D_DSE_2, v_min_ld + self.__V_D_DSE_3,
+                                                      v_min_ld + self.__V_D_DSE_4, np.minimum(self.__v_des_1[n], 220), np.minimum(self.__v_des_1[n], 250), self.__v_des_2[n], self.__m_des[n]], axis=-1),
+                                            # Else if Piston (Equation 4.3-5~7)
+                                            np.stack([v_min_ld + self.__V_D_DSE_5, v_min_ld + self.__V_D_DSE_6, v_min_ld + self.__V_D_DSE_7,
+                                                      self.__v_des_1[n], self.__v_des_2[n], self.__m_des[n], zero, zero], axis=-1))
+
+    def init_all_procedure_speeds(self, m):
+        """
+        Initialize standard air speed schedule for all flight phases of all aircraft at once (Section 4.1-4.3)
+
+        Parameters
+        ----------
+        m: float[]
+            Aircraft mass [kg]
+        """
+        self.init_procedure_speed(m, slice(None))
 
     def get_procedure_speed(self, H_p, H_p_trans, flight_phase):
         """
@@ -1105,39 +1515,22 @@ class Bada:
 
         TODO: Bound the speed schedule form the minimum and maximum speed.
         """
-        return np.select([
-            flight_phase <= FlightPhase.CLIMB,
-            flight_phase == FlightPhase.CRUISE,
-            flight_phase >= FlightPhase.DESCENT
-        ], [
-            # If climb
-            np.where(self.__engine_type == EngineType.JET,
-                     # If jet
-                     np.select([(H_p < 1500), (H_p >= 1500) & (H_p < 3000), (H_p >= 3000) & (H_p < 4000), (H_p >= 4000) & (H_p < 5000), (H_p >= 5000) & (H_p < 6000), (H_p >= 6000) & (H_p < 10000), (H_p >= 10000) & (H_p < H_p_trans), (H_p >= H_p_trans)],
-                               [self.climb_schedule[:, 0], self.climb_schedule[:, 1], self.climb_schedule[:, 2], self.climb_schedule[:, 3], self.climb_schedule[:, 4], self.climb_schedule[:, 5], self.climb_schedule[:, 6], self.climb_schedule[:, 7]]),
-                     # If turboprop and piston
-                     np.select([(H_p < 500), (H_p >= 500) & (H_p < 1000), (H_p >= 1000) & (H_p < 1500), (H_p >= 1500) & (H_p < 10000), (H_p >= 10000) & (H_p < H_p_trans), (H_p >= H_p_trans)],
-                               [self.climb_schedule[:, 0], self.climb_schedule[:, 1], self.climb_schedule[:, 2], self.climb_schedule[:, 3], self.climb_schedule[:, 4], self.climb_schedule[:, 5]])
-                     ),
-            # If cruise
-            np.where(self.__engine_type == EngineType.JET,
-                     # If jet
-                     np.select([(H_p < 3000), (H_p >= 3000) & (H_p < 6000), (H_p >= 6000) & (H_p < 14000), (H_p >= 14000) & (H_p < H_p_trans), (H_p >= H_p_trans)],
-                               [self.cruise_schedule[:, 0], self.cruise_schedule[:, 1], self.cruise_schedule[:, 2], self.cruise_schedule[:, 3], self.cruise_schedule[:, 4]]),
-                     # If turboprop and piston
-                     np.select([(H_p < 3000), (H_p >= 3000) & (H_p < 6000), (H_p >= 6000) & (H_p < 10000), (H_p >= 10000) & (H_p < H_p_trans), (H_p >= H_p_trans)],
-                               [self.cruise_schedule[:, 0], self.cruise_schedule[:, 1], self.cruise_schedule[:, 2], self.cruise_schedule[:, 3], self.cruise_schedule[:, 4]])
-                     ),
-            # If descent
-            np.where(self.__engine_type != EngineType.PISTON,
-                     # If jet and turboprop
-                     np.select([(H_p < 999), (H_p >= 1000) & (H_p < 1500), (H_p >= 1500) & (H_p < 2000), (H_p >= 2000) & (H_p < 3000), (H_p >= 3000) & (H_p < 6000), (H_p >= 6000) & (H_p < 10000), (H_p >= 10000) & (H_p < H_p_trans), (H_p >= H_p_trans)],
-                               [self.descent_schedule[:, 0], self.descent_schedule[:, 1], self.descent_schedule[:, 2], self.descent_schedule[:, 3], self.descent_schedule[:, 4], self.descent_schedule[:, 5], self.descent_schedule[:, 6], self.descent_schedule[:, 7]]),
-                     # If piston
-                     np.select([(H_p < 500), (H_p >= 500) & (H_p < 1000), (H_p >= 1000) & (H_p < 1500), (H_p >= 1500) & (H_p < 10000), (H_p >= 10000) & (H_p < H_p_trans), (H_p >= H_p_trans)],
-                               [self.descent_schedule[:, 0], self.descent_schedule[:, 1], self.descent_schedule[:, 2], self.descent_schedule[:, 3], self.descent_schedule[:, 4], self.descent_schedule[:, 5]])
-                     )
-        ])
+        # Flight phase [0: climb, 1: cruise, 2: descent] and engine group [0: jet (climb and cruise) or jet and turboprop (descent), 1: others]
+        phase = np.where(flight_phase <= FlightPhase.CLIMB, 0,
+                         np.where(flight_phase == FlightPhase.CRUISE, 1, 2))
+        group = np.where(phase == 2, self.__engine_type == EngineType.PISTON,
+                         self.__engine_type != EngineType.JET).astype(int)
+
+        # Index of the altitude range in the speed schedule, the highest range is split at the transition altitude
+        alt = self.__PROCEDURE_SPEED_ALT[phase, group]
+        i = np.count_nonzero(H_p[:, None] >= alt, axis=1)
+        i += H_p >= np.maximum(H_p_trans, np.nanmax(alt, axis=1))
+
+        v_std = np.empty(len(H_p))
+        for p, schedule in enumerate((self.climb_schedule, self.cruise_schedule, self.descent_schedule)):
+            index = phase == p
+            v_std[index] = schedule[index, i[index]]
+        return v_std
 
     def update_configuration(self, V_cas, H_p, vertical_mode):
         """
@@ -1159,25 +1552,9 @@ class Bada:
 
         TODO: Make use of Airport Elevation in calculation
         """
-        return np.select(condlist=[
-            (vertical_mode == VerticalMode.CLIMB) & (H_p <= self.__H_MAX_TO),
-            (vertical_mode == VerticalMode.CLIMB) & (
-                H_p > self.__H_MAX_TO) & (H_p < self.__H_MAX_IC),
-            (H_p > self.__H_MAX_IC) | (vertical_mode == VerticalMode.DESCENT) & (
-                (V_cas >= (self.__C_V_MIN * self.__v_stall_cr + 10.0))),
-            (vertical_mode == VerticalMode.DESCENT) & ((V_cas < self.__C_V_MIN * self.__v_stall_cr + 10.0) & (H_p > self.__H_MAX_LD) & (H_p <= self.__H_MAX_AP)
-                                                       ) | ((V_cas < (self.__C_V_MIN * self.__v_stall_cr + 10.0)) & (V_cas >= (self.__C_V_MIN * self.__v_stall_ap + 10.0)) & (H_p <= self.__H_MAX_LD)),
-            (vertical_mode == VerticalMode.DESCENT) & (H_p < self.__H_MAX_LD) & (
-                V_cas < (self.__C_V_MIN * self.__v_stall_ap + 10.0))
-        ],
-            choicelist=[
-            Config.TAKEOFF,
-            Config.INITIAL_CLIMB,
-            Config.CLEAN,
-            Config.APPROACH,
-            Config.LANDING
-        ],
-            default=Config.CLEAN)
+        V_cas, H_p, vertical_mode = broadcast_1d(V_cas, H_p, vertical_mode, length=self.__n)
+        return _update_configuration(self.__C_V_MIN, self.__H_MAX_TO, self.__H_MAX_IC, self.__H_MAX_AP, self.__H_MAX_LD,
+                                     self.__v_stall_cr, self.__v_stall_ap, V_cas, H_p, vertical_mode)
 
     # ----------------------------  Global aircraft parameters section 5 -----------------------------------------
     def cal_max_d_tas(self, d_t):
@@ -1216,7 +1593,10 @@ class Bada:
         d_rocd: float[]
             Delta rate of climb or descent [ft/s^2]
         """
-        return np.sin(np.arcsin(rocd/V_tas) - self.__A_N_MAX_CIV * d_t / V_tas) * (V_tas+d_t)
+        # sin(arcsin(rocd/V_tas) - B) expanded with the angle difference identity
+        sin_gamma = rocd/V_tas
+        B = self.__A_N_MAX_CIV * d_t / V_tas
+        return (sin_gamma * np.cos(B) - np.sqrt(1.0 - sin_gamma*sin_gamma) * np.sin(B)) * (V_tas+d_t)
 
     def cal_expedite_descend_factor(self, expedite_descent):
         """
@@ -1232,4 +1612,7 @@ class Bada:
         c_des_exp: float[]
             Coefficient of expedited descent factor [dimensionless]
         """
-        return np.where(expedite_descent, self.__C_DES_EXP, 1.0)
+        # 1 + (C_DES_EXP - 1) * expedite_descent, computed in one output array
+        c_des_exp = np.multiply(expedite_descent, self.__C_DES_EXP - 1.0, dtype=float)
+        c_des_exp += 1.0
+        return c_des_exp
@@ -0,0 +1,27 @@
+"""Shared helpers of the Numba kernels of the performance models"""
+import numpy as np
+
+
+JIT_OPTIONS = dict(cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, error_model="numpy")
+"""Numba options of all performance kernels (fast-math without nnan/ninf so that nan and inf still propagate)"""
+
+
+def broadcast_1d(*args, length=None):
+    """
+    Broadcast scalar or array inputs of a kernel to (read-only) 1-D arrays of one common length.
+
+    Parameters
+    ----------
+    *args: float or float[]
+        Inputs of the kernel
+
+    length: int, optional
+        Length of the arrays (e.g. number of aircraft), the broadcast length of the inputs if None
+
+    Returns
+    -------
+    args: list of float[]
+        Inputs of the common length, arrays already of that length are returned as they are
+    """
+    shape = (length,) if length is not None else np.broadcast_shapes(*(np.shape(x) for x in args)) or (1,)
+    return [x if isinstance(x, np.ndarray) and x.shape == shape else np.broadcast_to(x, shape) for x in args]
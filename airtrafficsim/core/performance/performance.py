@@ -1,26 +1,138 @@
 """Performance base class"""
+import math
 import numpy as np
+from numba import njit
 from openap import prop, Thrust, Drag, FuelFlow, WRAP
 
 from airtrafficsim.core.performance.bada import Bada
+from airtrafficsim.core.performance.kernel import JIT_OPTIONS, broadcast_1d
 from airtrafficsim.utils.enums import APSpeedMode, Config, VerticalMode
 from airtrafficsim.utils.unit_conversion import Unit
 
 
+# ----------------------------  Numba kernels -----------------------------------------
+# Element-wise BADA equations compiled into single loops over the aircraft arrays.
+
+@njit(**JIT_OPTIONS)
+def _cal_atmosphere(T_0, P_0, R, KAPPA, BETA_T_BELOW_TROP, H_P_TROP, p_exponent, p_trop, p_decay, H_p, d_T):
+    """Temperature [K], pressure [Pa], density [kg/m^3] and speed of sound [m/s] (Equation 3.1-12~22)"""
+    T = np.empty(H_p.shape[0])
+    p = np.empty(H_p.shape[0])
+    rho = np.empty(H_p.shape[0])
+    a = np.empty(H_p.shape[0])
+    for i in range(H_p.shape[0]):
+        # Temperature (Equation 3.1-12~16)
+        if H_p[i] < H_P_TROP:
+            T[i] = T_0 + d_T[i] + BETA_T_BELOW_TROP * H_p[i]
+        else:
+            T[i] = T_0 + d_T[i] + BETA_T_BELOW_TROP * H_P_TROP
+        # Pressure (Equation 3.1-18 and 3.1-20)
+        if H_p[i] <= H_P_TROP:
+            p[i] = P_0 * ((T[i] - d_T[i]) / T_0) ** p_exponent
+        else:
+            p[i] = p_trop * math.exp(p_decay * (H_p[i] - H_P_TROP))
+        # Density (Equation 3.1-21)
+        rho[i] = p[i] / (R * T[i])
+        # Speed of sound (Equation 3.1-22)
+        a[i] = math.sqrt(KAPPA * R * T[i])
+    return T, p, rho, a
+
+
+@njit(**JIT_OPTIONS)
+def _cal_energy_share_factor(KAPPA, R, BETA_T_BELOW_TROP, G_0, H_P_TROP, H_p, T, d_T, M, ap_speed_mode, vertical_mode, f_M):
+    """Energy share factor of each aircraft in its speed mode, written to f_M [dimensionless] (Equation 3.2-5, 8~11)"""
+    for i in range(H_p.shape[0]):
+        if ap_speed_mode[i] == APSpeedMode.CONSTANT_MACH.value:
+            if H_p[i] > H_P_TROP:
+                # Conditiona a: Constant Mach number in stratosphere (Equation 3.2-8)
+                f_M[i] = 1.0
+            else:
+                # Condition b: Constant Mach number below tropopause (Equation 3.2-9)
+                f_M[i] = 1.0 / (1.0 + KAPPA*R*BETA_T_BELOW_TROP/2.0/G_0 * M[i]*M[i] * (T[i]-d_T[i])/T[i])
+        elif ap_speed_mode[i] == APSpeedMode.CONSTANT_CAS.value:
+            # (1 + (kappa-1)/2 M^2)^(-1/(kappa-1)) * ((1 + (kappa-1)/2 M^2)^(kappa/(kappa-1)) - 1) reduced to x - x^(-1/(kappa-1))
+            x = 1.0 + (KAPPA-1.0)/2.0 * M[i]*M[i]
+            cas_term = x - x ** (-1.0/(KAPPA-1.0))
+            if H_p[i] <= H_P_TROP:
+                # Condition c: Constant Calibrated Airspeed (CAS) below tropopause (Equation 3.2-10)
+                f_M[i] = 1.0 / (1.0 + KAPPA*R*BETA_T_BELOW_TROP/2.0/G_0 * M[i]*M[i] * (T[i]-d_T[i])/T[i] + cas_term)
+            else:
+                # Condition d: Constant Calibrated Airspeed (CAS) above tropopause (Equation 3.2-11)
+                f_M[i] = 1.0 / (1.0 + cas_term)
+        elif ap_speed_mode[i] == APSpeedMode.ACCELERATE.value:
+            # Acceleration in climb + Acceleration in descent
+            f_M[i] = 0.3 if vertical_mode[i] == VerticalMode.CLIMB.value else 1.7 if vertical_mode[i] == VerticalMode.DESCENT.value else 0.0
+        elif ap_speed_mode[i] == APSpeedMode.DECELERATE.value:
+            # Deceleration in descent + Deceleration in climb
+            f_M[i] = 0.3 if vertical_mode[i] == VerticalMode.DESCENT.value else 1.7 if vertical_mode[i] == VerticalMode.CLIMB.value else 0.0
+        else:
+            f_M[i] = 0.0
+    return f_M
+
+
+@njit(**JIT_OPTIONS)
+def _cal_tem_rocd(G_0, T, d_T, m, D, f_M, Thr, V_tas, C_pow_red):
+    """Rate of climb or descent [m/s] (Equation 3.2-1a and 3.2-7)"""
+    rocd = np.empty(T.shape[0])
+    for i in range(T.shape[0]):
+        rocd[i] = (T[i]-d_T[i])/T[i] * (Thr[i]-D[i])*V_tas[i]*C_pow_red[i]/m[i]/G_0 * f_M[i]
+    return rocd
+
+
+@njit(**JIT_OPTIONS)
+def _cal_tem_accel(G_0, T, d_T, m, D, rocd, Thr, V_tas):
+    """Acceleration of true air speed [m/s^2] (Equation 3.2-1 and 3.2-7)"""
+    accel = np.empty(T.shape[0])
+    for i in range(T.shape[0]):
+        if V_tas[i] == 0:
+            accel[i] = (Thr[i] - D[i]) / m[i]
+        else:
+            accel[i] = (Thr[i] - D[i]) / m[i] - G_0 / V_tas[i] * rocd[i]*T[i]/(T[i]-d_T[i])
+    return accel
+
+
+@njit(**JIT_OPTIONS)
+def _cal_tem_vs_accel(G_0, MPS_TO_FTPM, T, d_T, m, D, f_M, Thr, V_tas, C_pow_red, ap_speed_mode):
+    """Vertical speed [ft/min] and acceleration [m/s^2] of the Total Energy Model in one pass (Equation 3.2-1, 3.2-1a and 3.2-7)"""
+    vs = np.empty(T.shape[0])
+    accel = np.empty(T.shape[0])
+    for i in range(T.shape[0]):
+        T_ratio = (T[i]-d_T[i])/T[i]
+        rocd = T_ratio * (Thr[i]-D[i])*V_tas[i]*C_pow_red[i]/m[i]/G_0 * f_M[i]
+        vs[i] = rocd * MPS_TO_FTPM
+        if ap_speed_mode[i] == APSpeedMode.ACCELERATE.value or ap_speed_mode[i] == APSpeedMode.DECELERATE.value:
+            if V_tas[i] == 0:
+                accel[i] = (Thr[i] - D[i]) / m[i]
+            else:
+                accel[i] = (Thr[i] - D[i]) / m[i] - G_0 / V_tas[i] * rocd / T_ratio
+        else:
+            accel[i] = 0.0
+    return vs, accel
+
+
+@njit(**JIT_OPTIONS)
+def _cal_tem_thrust(G_0, T, d_T, m, D, f_M, rocd, V_tas):
+    """Thrust acting parallel to the aircraft velocity vector [N] (Equation 3.2-1c and 3.2-7)"""
+    Thr = np.empty(T.shape[0])
+    for i in range(T.shape[0]):
+        Thr[i] = rocd[i] / f_M[i] / ((T[i]-d_T[i])/T[i]) * m[i]*G_0 / V_tas[i] + D[i]
+    return Thr
+
+
 class Performance:
     """
     Performance base class
     """
 
-    def __init__(self, performance_mode):
+    def __init__(self, performance_mode, N=100):
         """
         Initialize Performance base class
 
         Parameters
         ----------
         N : int, optional
-            Number of aircrafts. Maximum size of performance array (pre-initialize to eliminate inefficient append)
-            TODO: Revise the initial estimate, by default 1000
+            Number of aircrafts. Initial size of performance array (pre-initialize to eliminate inefficient append).
+            The capacity is doubled when more aircraft are added, by default 100
         Bada : bool, optional
             Whether to use BADA Performance model, by default False
         """
@@ -29,7 +141,7 @@ class Performance:
         """Whether BADA performance model is used [Boolean]"""
 
         if (self.performance_mode == "BADA"):
-            self.perf_model = Bada()
+            self.perf_model = Bada(N)
         else:
             # OpenAP
             self.prop_model = []
@@ -37,6 +149,8 @@ class Performance:
             self.drag_model = []
             self.fuel_flow_model = []
             self.wrap_model = []
+            self.__type_models = {}
+            """OpenAP models shared by the aircraft of each type {(icao, engine): (type id, prop, Thrust, Drag, FuelFlow, WRAP)}"""
 
             # self.prop_model = np.empty([N], dtype=np.void)
             # self.thrust_model = np.empty([N], dtype=np.void)
@@ -50,6 +164,26 @@ class Performance:
         """Thrust [N]"""
         self.esf = np.zeros([0])
         """Energy share factor [dimensionless]"""
+        self.fuel_burn = np.zeros([0])
+        """Fuel burn [kg/s]"""
+
+        # OpenAP aircraft constants
+        self.__oew = np.zeros([0])
+        """Operating empty weight (OpenAP) [kg]"""
+        self.__ceiling = np.zeros([0])
+        """Ceiling (OpenAP) [m]"""
+        self.__cross_alt = np.zeros([0])
+        """Default climb crossover altitude at constant Mach (OpenAP WRAP)"""
+        self.__type_id = np.zeros([0])
+        """Type id of the OpenAP models of each aircraft (see __type_models)"""
+
+        # Pre-allocated storage of the per-aircraft arrays above, which are views of the first n aircraft
+        self.__capacity = N
+        """Number of aircraft the storage can hold before growing"""
+        self.__n = 0
+        """Number of aircraft in the performance array"""
+        self.__storage = np.zeros((8, N))
+        """Storage with one contiguous row per array [drag / thrust / energy share factor / fuel burn / OpenAP constants, aircraft]"""
 
         # ----------------------------  Atmosphere model (Ref: BADA user menu section 3.1) -----------------------------------------
         # MSL Standard atmosphere condition
@@ -64,6 +198,8 @@ class Performance:
         # Expression
         self.__KAPPA = 1.4
         """Adiabatic index of air [dimensionless]"""
+        self.__MU = (self.__KAPPA - 1.0) / self.__KAPPA
+        """Exponent of the CAS/TAS conversion [dimensionless] (Equation 3.1-23~24)"""
         self.__R = 287.05287
         """Real gas constant of air [m^2/(K*s^2)]"""
         self.__G_0 = 9.80665
@@ -73,6 +209,21 @@ class Performance:
         # Tropopause (separation between troposphere (below) and stratosphere (above))
         self.__H_P_TROP = 11000
         """Geopotential pressure altitude [m]"""
+        self.__T_TROP = self.__T_0 + self.__BETA_T_BELOW_TROP * self.__H_P_TROP
+        """ISA temperature at tropopause [K] (Equation 3.1-16)"""
+        self.__P_TROP = self.__P_0 * np.power(self.__T_TROP / self.__T_0, -self.__G_0 / (self.__BETA_T_BELOW_TROP * self.__R))
+        """Pressure at tropopause [Pa] (Equation 3.1-19)"""
+        self.__MPS_TO_FTPM = Unit.mps2ftpm(1.0)
+        """Conversion factor of vertical speed [ft/min per m/s]"""
+
+        # ----------------------------  Bank angle (Ref: BADA user menu section 5.3) -----------------------------------------
+        if (self.performance_mode == "BADA"):
+            phi_told, phi_others = self.perf_model._Bada__PHI_NORM_CIV_TOLD, self.perf_model._Bada__PHI_NORM_CIV_OTHERS
+        else:
+            phi_told, phi_others = 15.0, 30.0
+        self.__BANK_ANGLES = np.full(max(Config) + 1, phi_others, dtype=float)
+        """Nominal bank angle indexed by configuration [deg]"""
+        self.__BANK_ANGLES[[Config.TAKEOFF, Config.LANDING]] = phi_told
 
     def add_aircraft(self, icao, engine=None, mass_class=2):
         """
@@ -83,26 +234,41 @@ class Performance:
         n: int
             Index of the added aircraft
         """
-        self.drag = np.append(self.drag, 0.0)
-        self.thrust = np.append(self.thrust, 0.0)
-        self.esf = np.append(self.esf, 0.0)
+        if self.__n == self.__capacity:
+            self.__capacity *= 2
+            storage = self.__storage
+            self.__storage = np.zeros((storage.shape[0], self.__capacity))
+            self.__storage[:, :self.__n] = storage[:, :self.__n]
+        self.__storage[:, self.__n] = 0.0
+        self.__n += 1
+        self.__update_view()
 
         if (self.performance_mode == "BADA"):
             self.perf_model.add_aircraft(icao, mass_class)
         else:
-            self.prop_model.append(prop.aircraft(icao))
-            self.thrust_model.append(Thrust(ac=icao, eng=engine))
-            self.drag_model.append(Drag(ac=icao))
-            self.fuel_flow_model.append(FuelFlow(ac=icao, eng=engine))
-            self.wrap_model.append(WRAP(ac=icao))
+            # The models of an aircraft type are built once and shared by all aircraft of that type
+            if (icao, engine) not in self.__type_models:
+                self.__type_models[(icao, engine)] = (len(self.__type_models), prop.aircraft(icao), Thrust(ac=icao, eng=engine),
+                                                      Drag(ac=icao), FuelFlow(ac=icao, eng=engine), WRAP(ac=icao))
+            type_id, prop_model, thrust_model, drag_model, fuel_flow_model, wrap_model = self.__type_models[(icao, engine)]
+            self.prop_model.append(prop_model)
+            self.thrust_model.append(thrust_model)
+            self.drag_model.append(drag_model)
+            self.fuel_flow_model.append(fuel_flow_model)
+            self.wrap_model.append(wrap_model)
+            self.__type_id[-1] = type_id
+            self.__oew[-1] = self.prop_model[-1]['limits']['OEW']
+            self.__ceiling[-1] = self.prop_model[-1]['limits']['ceiling']
+            self.__cross_alt[-1] = self.wrap_model[-1].climb_cross_alt_conmach()['default']
 
     def del_aircraft(self, index):
         """
         Delete an aircraft from traffic array.
         """
-        self.drag = np.delete(self.drag, index)
-        self.thrust = np.delete(self.thrust, index)
-        self.esf = np.delete(self.esf, index)
+        # Shift the following aircraft forward in place to keep the same order as Traffic
+        self.__storage[:, index:self.__n-1] = self.__storage[:, index+1:self.__n]
+        self.__n -= 1
+        self.__update_view()
         if (self.performance_mode == "BADA"):
             self.perf_model.del_aircraft(index)
         else:
@@ -112,6 +278,29 @@ class Performance:
             del self.fuel_flow_model[index]
             del self.wrap_model[index]
 
+    def __type_groups(self):
+        """
+        Group the aircraft by OpenAP type.
+
+        Yields
+        ------
+        idx: int[]
+            Indices of the aircraft of the type
+
+        models: tuple
+            Shared OpenAP models of the type (prop, Thrust, Drag, FuelFlow, WRAP)
+        """
+        for type_id, *models in self.__type_models.values():
+            idx = np.flatnonzero(self.__type_id == type_id)
+            if idx.size > 0:
+                yield idx, models
+
+    def __update_view(self):
+        """
+        Point drag, thrust, energy share factor, fuel burn and the OpenAP constants to the first n aircraft of the storage.
+        """
+        self.drag, self.thrust, self.esf, self.fuel_burn, self.__oew, self.__ceiling, self.__cross_alt, self.__type_id = self.__storage[:, :self.__n]
+
     def init_procedure_speed(self, mass, n):
         """
         Initialize standard air speed schedule for all flight phases (Section 4.1-4.3)
@@ -215,8 +404,7 @@ class Performance:
                         np.power((T - d_T) / self.__T_0, -self.__G_0 / \
                                  (self.__BETA_T_BELOW_TROP * self.__R)),
                         # If above Geopotential pressure altitude of tropopause (Equation 3.1-20)
-                        self.__P_0 * np.power((self.cal_temperature(self.__H_P_TROP, d_T) - d_T) / self.__T_0, -self.__G_0/(self.__BETA_T_BELOW_TROP * self.__R)) \
-                        * np.exp(-self.__G_0/(self.__R * self.cal_temperature(self.__H_P_TROP, 0.0)) * (H_p - self.__H_P_TROP))
+                        self.__P_TROP * np.exp(-self.__G_0/(self.__R * self.__T_TROP) * (H_p - self.__H_P_TROP))
                         )
 
     def cal_air_density(self, p, T):
@@ -238,6 +426,37 @@ class Performance:
         """
         return p / (self.__R * T)
 
+    def cal_atmosphere(self, H_p, d_T):
+        """
+        Calculate temperature, air pressure, air density and speed of sound in one pass (Equation 3.1-12~22)
+
+        Parameters
+        ----------
+        H\_p: float[]
+            Geopotential pressuer altitude [m]
+
+        d\_T: float[]
+            Temperature differential at MSL [K]
+
+        Returns
+        -------
+        T: float[]
+            Temperature [K]
+
+        p: float[]
+            Pressure [Pa]
+
+        rho: float[]
+            Density [kg/m^3]
+
+        a: float[]
+            Speed of sound [m/s]
+        """
+        p_exponent = -self.__G_0 / (self.__BETA_T_BELOW_TROP * self.__R)
+        p_decay = -self.__G_0 / (self.__R * self.__T_TROP)
+        H_p, d_T = broadcast_1d(H_p, d_T)
+        return _cal_atmosphere(self.__T_0, self.__P_0, self.__R, self.__KAPPA, self.__BETA_T_BELOW_TROP, self.__H_P_TROP, p_exponent, self.__P_TROP, p_decay, H_p, d_T)
+
     def cal_speed_of_sound(self, T):
         """
         Calculate speed of sound. (Equation 3.1-22)
@@ -274,8 +493,21 @@ class Performance:
         V_tas : float[]
             True air speed [m/s]
         """
-        mu = (self.__KAPPA - 1) / self.__KAPPA
-        return np.power(2.0/mu * p/rho * (np.power(1.0 + self.__P_0/p * (np.power(1.0 + mu/2.0 * self.__RHO_0/self.__P_0 * np.square(V_cas), 1.0/mu) - 1), mu)-1), 0.5)
+        # Evaluated in place in one buffer of the broadcast shape, [()] unwraps the result of scalar inputs
+        x = np.square(V_cas, out=np.empty(np.broadcast(V_cas, p, rho).shape))
+        x *= self.__MU/2.0 * self.__RHO_0/self.__P_0
+        x += 1.0
+        np.power(x, 1.0/self.__MU, out=x)
+        x -= 1.0
+        x *= self.__P_0
+        x /= p
+        x += 1.0
+        np.power(x, self.__MU, out=x)
+        x -= 1.0
+        x *= p
+        x /= rho
+        x *= 2.0/self.__MU
+        return np.sqrt(x, out=x)[()]
 
     def tas_to_cas(self, V_tas, p, rho):
         """
@@ -297,8 +529,21 @@ class Performance:
         V_cas : float[]
             Calibrated air speed [m/s]
         """
-        mu = (self.__KAPPA - 1) / self.__KAPPA
-        return np.power(2/mu * self.__P_0/self.__RHO_0 * (np.power(1.0 + p/self.__P_0 * (np.power(1 + mu/2 * rho/p * np.square(V_tas), 1.0/mu) - 1.0), mu) - 1.0), 0.5)
+        # Evaluated in place in one buffer of the broadcast shape, [()] unwraps the result of scalar inputs
+        x = np.square(V_tas, out=np.empty(np.broadcast(V_tas, p, rho).shape))
+        x *= self.__MU/2.0
+        x *= rho
+        x /= p
+        x += 1.0
+        np.power(x, 1.0/self.__MU, out=x)
+        x -= 1.0
+        x *= p
+        x /= self.__P_0
+        x += 1.0
+        np.power(x, self.__MU, out=x)
+        x -= 1.0
+        x *= 2.0/self.__MU * self.__P_0/self.__RHO_0
+        return np.sqrt(x, out=x)[()]
 
     def mach_to_tas(self, M, T):
         """
@@ -317,7 +562,26 @@ class Performance:
         V_tas: float[]
             True air speed [m/s]
         """
-        return M * np.sqrt(self.__KAPPA * self.__R * T)
+        return self.mach_to_tas_from_a(M, self.cal_speed_of_sound(T))
+
+    def mach_to_tas_from_a(self, M, a):
+        """
+        Convert Mach number to True Air speed given the speed of sound (Equation 3.1-26)
+
+        Parameters
+        ----------
+        M: float[]
+            Mach number [dimensionless]
+
+        a: float[]
+            Speed of sound [m/s]
+
+        Returns
+        -------
+        V_tas: float[]
+            True air speed [m/s]
+        """
+        return M * a
 
     def tas_to_mach(self, V_tas, T):
         """
@@ -336,7 +600,26 @@ class Performance:
         M: float[]
             Mach number [dimensionless]
         """
-        return V_tas / np.sqrt(self.__KAPPA * self.__R * T)
+        return self.tas_to_mach_from_a(V_tas, self.cal_speed_of_sound(T))
+
+    def tas_to_mach_from_a(self, V_tas, a):
+        """
+        Convert True Air speed to Mach number given the speed of sound (Equation 3.1-26)
+
+        Parameters
+        ----------
+        V_tas: float[]
+            True air speed [m/s]
+
+        a: float[]
+            Speed of sound [m/s]
+
+        Returns
+        -------
+        M: float[]
+            Mach number [dimensionless]
+        """
+        return V_tas / a
 
     # ----------------------------  Operation limit -----------------------------------------
     def cal_transition_alt(self, n, d_T):
@@ -370,8 +653,7 @@ class Performance:
 
             p_trans = self.__P_0 * (np.power(1.0 + (self.__KAPPA-1.0)/2.0 * np.square(V_cas/self.__A_0), self.__KAPPA/(self.__KAPPA-1.0)) - 1.0) \
                 / (np.power(1.0 + (self.__KAPPA-1.0)/2.0 * np.square(M), self.__KAPPA/(self.__KAPPA-1.0)) - 1.0)  # Equation 3.1-28
-            p_trop = self.cal_air_pressure(
-                self.__H_P_TROP, self.cal_temperature(self.__H_P_TROP, d_T), d_T)
+            p_trop = self.__P_TROP
 
             return np.where(p_trans >= p_trop,
                             # If __p_trans >= __p_trop
@@ -379,10 +661,10 @@ class Performance:
                             (np.power(p_trans/self.__P_0, - \
                              self.__BETA_T_BELOW_TROP*self.__R/self.__G_0) - 1.0),
                             # __p_trans < __p_trop
-                            self.__H_P_TROP - self.__R*self.cal_temperature(self.__H_P_TROP, 0.0)/self.__G_0 * np.log(p_trans/p_trop))
+                            self.__H_P_TROP - self.__R*self.__T_TROP/self.__G_0 * np.log(p_trans/p_trop))
 
         else:
-            return np.array([x.climb_cross_alt_conmach()['default'] for x in self.wrap_model])
+            return self.__cross_alt[n]
 
     def get_empty_weight(self, n):
         """
@@ -401,7 +683,7 @@ class Performance:
         if (self.performance_mode == "BADA"):
             return self.perf_model.m_min[n] * 1000.0
         else:
-            return self.prop_model[n]['limits']['OEW']
+            return self.__oew[n]
 
     def cal_maximum_alt(self, d_T, m):
         """
@@ -423,7 +705,7 @@ class Performance:
         if (self.performance_mode == "BADA"):
             return self.perf_model.cal_maximum_altitude(d_T, m)
         else:
-            return Unit.m2ft(np.array([x['limits']['ceiling'] for x in self.prop_model]))
+            return Unit.m2ft(self.__ceiling)
 
     def cal_maximum_speed(self):
         """
@@ -503,7 +785,7 @@ class Performance:
     # ----------------------------  Performance -----------------------------------------
     # ----------------------------  Total-Energy Model Section 3.2 -----------------------------------------
 
-    def cal_energy_share_factor(self, H_p, T, d_T, M, ap_speed_mode, vertical_mode):
+    def cal_energy_share_factor(self, H_p, T, d_T, M, ap_speed_mode, vertical_mode, out=None):
         """
         Calculate energy share factor (Equation 3.2-5, 8~11)
 
@@ -527,43 +809,18 @@ class Performance:
         vertical_mode: float[]
             Vertical mode from Traffic class [Vertical_mode enum]
 
+        out: float[], optional
+            Preallocated array to write the energy share factor to
+
         Returns
         -------
         f{M}: float[]
-            Energy share factor [dimenesionless]
+            Energy share factor [dimenesionless] (out if given)
         """
-        return np.select(condlist=[
-            ap_speed_mode == APSpeedMode.CONSTANT_MACH,
-            ap_speed_mode == APSpeedMode.CONSTANT_CAS,
-            ap_speed_mode == APSpeedMode.ACCELERATE,
-            ap_speed_mode == APSpeedMode.DECELERATE],
-
-            choicelist=[
-            # Constant Mach
-            np.where(H_p > self.__H_P_TROP,
-                     # Conditiona a: Constant Mach number in stratosphere (Equation 3.2-8)
-                     1.0,
-                     # Condition b: Constant Mach number below tropopause (Equation 3.2-9)
-                     np.power(1.0 + self.__KAPPA*self.__R*self.__BETA_T_BELOW_TROP/2.0/self.__G_0 * np.square(M) * (T-d_T)/T, -1.0)),
-
-            # Constnt CAS
-            np.where(H_p <= self.__H_P_TROP,
-                     # Condition c: Constant Calibrated Airspeed (CAS) below tropopause (Equation 3.2-10)
-                     np.power(1.0 + self.__KAPPA*self.__R*self.__BETA_T_BELOW_TROP/2.0/self.__G_0 * np.square(M) * (T-d_T)/T \
-                              + np.power(1.0 + (self.__KAPPA-1.0)/2.0 * np.square(M), -1.0/(self.__KAPPA-1.0)) \
-                              * (np.power(1.0 + (self.__KAPPA-1.0)/2.0 * np.square(M), self.__KAPPA/(self.__KAPPA-1.0)) - 1.0), -1.0),
-                     # Condition d: Constant Calibrated Airspeed (CAS) above tropopause (Equation 3.2-11)
-                     np.power(1.0 + np.power(1.0 + (self.__KAPPA-1.0)/2.0 * np.square(M), -1.0/(self.__KAPPA-1)) \
-                              * (np.power(1.0 + (self.__KAPPA-1.0)/2.0 * np.square(M), self.__KAPPA/(self.__KAPPA-1.0)) - 1.0), -1.0)),
-
-            # Acceleration in climb + Acceleration in descent
-            (vertical_mode == VerticalMode.CLIMB) * 0.3 + \
-            (vertical_mode == VerticalMode.DESCENT) * 1.7,
-
-            # Deceleration in descent + Deceleration in climb
-            (vertical_mode == VerticalMode.DESCENT) * 0.3 + \
-            (vertical_mode == VerticalMode.CLIMB) * 1.7
-        ])
+        H_p, T, d_T, M, ap_speed_mode, vertical_mode = broadcast_1d(H_p, T, d_T, M, ap_speed_mode, vertical_mode)
+        f_M = np.empty(len(H_p)) if out is None else out
+        return _cal_energy_share_factor(self.__KAPPA, self.__R, self.__BETA_T_BELOW_TROP, self.__G_0, self.__H_P_TROP,
+                                        H_p, T, d_T, M, ap_speed_mode, vertical_mode, f_M)
 
     def cal_tem_rocd(self, T, d_T, m, D, f_M, Thr, V_tas, C_pow_red):
         """
@@ -593,7 +850,7 @@ class Performance:
         V_tas: float[]
             True airspeed [m/s]
 
-        C_pow_red: float[]
+        C_pow_red: float[] or float
             Reduced climb power coefficient [dimensionless]
 
         Returns
@@ -602,7 +859,8 @@ class Performance:
             Rate of climb or descent [m/s]
             Defined as variation with time of the aircraft geopotential pressure altitude H_p
         """
-        return (T-d_T)/T * (Thr-D)*V_tas*C_pow_red/m/self.__G_0 * f_M
+        T, d_T, m, D, f_M, Thr, V_tas, C_pow_red = broadcast_1d(T, d_T, m, D, f_M, Thr, V_tas, C_pow_red)
+        return _cal_tem_rocd(self.__G_0, T, d_T, m, D, f_M, Thr, V_tas, C_pow_red)
 
     def cal_tem_accel(self, T, d_T, m, D, rocd, Thr, V_tas):
         """
@@ -638,7 +896,8 @@ class Performance:
             Acceleration of tur air speed [m/s^2]
         """
         # return rocd / f_M / ((T-d_T)/T) * m*self.__G_0 / (Thr-D)
-        return np.where(V_tas == 0, (Thr - D) / m, (Thr - D) / m - self.__G_0 / V_tas * rocd*T/(T-d_T))
+        T, d_T, m, D, rocd, Thr, V_tas = broadcast_1d(T, d_T, m, D, rocd, Thr, V_tas)
+        return _cal_tem_accel(self.__G_0, T, d_T, m, D, rocd, Thr, V_tas)
 
     def cal_tem_thrust(self, T, d_T, m, D, f_M, rocd, V_tas):
         """
@@ -673,39 +932,36 @@ class Performance:
         Thr: float[]
             Thrust acting parallel to the aircraft velocity vector [N]
         """
-        return rocd / f_M / ((T-d_T)/T) * m*self.__G_0 / V_tas + D
+        T, d_T, m, D, f_M, rocd, V_tas = broadcast_1d(T, d_T, m, D, f_M, rocd, V_tas)
+        return _cal_tem_thrust(self.__G_0, T, d_T, m, D, f_M, rocd, V_tas)
 
     def cal_vs_accel(self, traffic, tas):
         if (self.performance_mode == "BADA"):
             # Drag and Thrust
             self.drag = self.perf_model.cal_aerodynamic_drag(tas, traffic.bank_angle, traffic.mass, traffic.weather.rho,
-                                                             traffic.configuration, self.perf_model.cal_expedite_descend_factor(traffic.ap.expedite_descent))
+                                                             traffic.configuration, self.perf_model.cal_expedite_descend_factor(traffic.ap.expedite_descent), out=self.drag)
             self.thrust = self.perf_model.cal_thrust(
-                traffic.vertical_mode, traffic.configuration, traffic.alt, traffic.tas, traffic.weather.d_T, self.drag, traffic.ap.speed_mode)
+                traffic.vertical_mode, traffic.configuration, traffic.alt, traffic.tas, traffic.weather.d_T, self.drag, traffic.ap.speed_mode, out=self.thrust)
         else:
-            self.drag = np.array([x.clean(mass=traffic.mass, tas=traffic.tas,
-                                 alt=traffic.alt, path_angle=traffic.path_angle) for x in self.drag_model])
-            # drag.nonclean(mass=60000, tas=150, alt=100, flap_angle=20, path_angle=10, landing_gear=True)
-            self.thrust = np.array(
-                [x.cruise(tas=traffic.cas, alt=traffic.alt) for x in self.thrust_model])
-            # T = thrust.takeoff(tas=100, alt=0) T = thrust.climb(tas=200, alt=20000, roc=1000)
+            # One vectorized OpenAP call per aircraft type
+            for idx, (_, thrust_model, drag_model, _, _) in self.__type_groups():
+                self.drag[idx] = drag_model.clean(mass=traffic.mass[idx], tas=traffic.tas[idx],
+                                                  alt=traffic.alt[idx], path_angle=traffic.path_angle[idx])
+                # drag.nonclean(mass=60000, tas=150, alt=100, flap_angle=20, path_angle=10, landing_gear=True)
+                self.thrust[idx] = thrust_model.cruise(tas=traffic.cas[idx], alt=traffic.alt[idx])
+                # T = thrust.takeoff(tas=100, alt=0) T = thrust.climb(tas=200, alt=20000, roc=1000)
 
         # Total Energy Model
         self.esf = self.cal_energy_share_factor(Unit.ft2m(traffic.alt), traffic.weather.T, traffic.weather.d_T,
-                                                traffic.mach, traffic.ap.speed_mode, traffic.vertical_mode)      # Energy share factor
+                                                traffic.mach, traffic.ap.speed_mode, traffic.vertical_mode, out=self.esf)      # Energy share factor
         if (self.performance_mode == "BADA"):
-            rocd = self.cal_tem_rocd(traffic.weather.T, traffic.weather.d_T, traffic.mass, self.drag, self.esf,
-                                     self.thrust, tas, self.perf_model.cal_reduced_climb_power(traffic.mass, traffic.alt, traffic.max_alt))
+            C_pow_red = self.perf_model.cal_reduced_climb_power(traffic.mass, traffic.alt, traffic.max_alt)
         else:
-            rocd = self.cal_tem_rocd(traffic.weather.T, traffic.weather.d_T,
-                                     traffic.mass, self.drag, self.esf, self.thrust, tas, 1.0)
-
-        accel = np.where((traffic.ap.speed_mode == APSpeedMode.ACCELERATE) | (traffic.ap.speed_mode == APSpeedMode.DECELERATE),
-                         self.cal_tem_accel(
-                             traffic.weather.T, traffic.weather.d_T, traffic.mass, self.drag, rocd, self.thrust, tas),
-                         0.0)
+            C_pow_red = 1.0
 
-        return Unit.mps2ftpm(rocd), accel
+        # Rate of climb or descent and acceleration in one pass over the aircraft
+        return _cal_tem_vs_accel(self.__G_0, self.__MPS_TO_FTPM, traffic.weather.T, traffic.weather.d_T, traffic.mass, self.drag, self.esf,
+                                 self.thrust, tas, np.broadcast_to(C_pow_red, np.shape(traffic.weather.T)), traffic.ap.speed_mode)
 
     def cal_fuel_burn(self, flight_phase, tas, alt):
         """
@@ -725,12 +981,16 @@ class Performance:
         Returns
         -------
         Fuel burn : float[]
-            Fuel burn [kg/s]
+            Fuel burn [kg/s] (self.fuel_burn, overwritten on the next call)
         """
         if (self.performance_mode == "BADA"):
-            return self.perf_model.cal_fuel_burn(flight_phase, tas, self.thrust, alt)
+            return self.perf_model.cal_fuel_burn(flight_phase, tas, self.thrust, alt, out=self.fuel_burn)
         else:
-            return [x.at_thrust(acthr=self.thrust, alt=alt) for x in self.fuel_flow_model]
+            alt, = broadcast_1d(alt, length=self.__n)
+            # One vectorized OpenAP call per aircraft type, written into the fuel burn storage row
+            for idx, (_, _, _, fuel_flow_model, _) in self.__type_groups():
+                self.fuel_burn[idx] = fuel_flow_model.at_thrust(acthr=self.thrust[idx], alt=alt[idx])
+            return self.fuel_burn
         # FF = fuelflow.takeoff(tas=100, alt=0, throttle=1)
         # FF = fuelflow.enroute(mass=60000, tas=200, alt=20000, path_angle=3)
         # FF = fuelflow.enroute(mass=60000, tas=230, alt=32000, path_angle=0)
@@ -753,7 +1013,11 @@ class Performance:
         Rate of turn : float[]
             Rate of turn [deg/s]
         """
-        return np.rad2deg(self.__G_0 / V_tas * np.tan(np.deg2rad(bank_angle)))
+        x = np.multiply(bank_angle, np.pi/180.0, out=np.empty(np.broadcast(bank_angle, V_tas).shape))
+        np.tan(x, out=x)
+        x *= self.__G_0 * 180.0/np.pi
+        x /= V_tas
+        return x[()]
 
     def cal_bank_angle(self, rate_of_turn, V_tas):
         """
@@ -772,7 +1036,11 @@ class Performance:
         bank_angle: float[]
             Bank angle [deg]
         """
-        return np.rad2deg(np.arctan(np.deg2rad(rate_of_turn) * V_tas / self.__G_0))
+        x = np.multiply(rate_of_turn, np.pi/180.0 / self.__G_0, out=np.empty(np.broadcast(rate_of_turn, V_tas).shape))
+        x *= V_tas
+        np.arctan(x, out=x)
+        x *= 180.0/np.pi
+        return x[()]
 
     def cal_turn_radius(self, bank_angle, V_tas):
         """
@@ -791,7 +1059,11 @@ class Performance:
         turn_radius: float[]
             Turn radius [m]
         """
-        return np.square(V_tas) / self.__G_0 / np.tan(np.deg2rad(bank_angle))
+        x = np.multiply(bank_angle, np.pi/180.0, out=np.empty(np.broadcast(bank_angle, V_tas).shape))
+        np.tan(x, out=x)
+        x *= self.__G_0
+        np.divide(np.square(V_tas), x, out=x)
+        return x[()]
 
     def get_bank_angles(self, configuration):
         """
@@ -807,10 +1079,7 @@ class Performance:
         bank_angles :float 
             Bank angles [deg]
         """
-        if (self.performance_mode == "BADA"):
-            return np.where((configuration == Config.TAKEOFF) | (configuration == Config.LANDING), self.perf_model._Bada__PHI_NORM_CIV_TOLD, self.perf_model._Bada__PHI_NORM_CIV_OTHERS)
-        else:
-            return np.where((configuration == Config.TAKEOFF) | (configuration == Config.LANDING), 15.0, 30.0)
+        return self.__BANK_ANGLES[np.asarray(configuration, dtype=np.intp)]
 
     def update_configuration(self, V_cas, H_p, vertical_mode):
         """
@@ -833,4 +1102,4 @@ class Performance:
         if (self.performance_mode == "BADA"):
             return self.perf_model.update_configuration(V_cas, H_p, vertical_mode)
         else:
-            return np.array([Config.CLEAN])
+            return np.full(len(H_p), Config.CLEAN, dtype=float)
@@ -329,7 +329,7 @@ class Traffic:
         # Air Speed
         # self.tas = self.perf.cas_to_tas(self.cas, self.weather.p, self.weather.rho)
         tas = tas + self.accel
-        self.mach = self.perf.tas_to_mach(tas, self.weather.T)
+        self.mach = self.perf.tas_to_mach_from_a(tas, self.weather.a)
         self.cas = Unit.mps2kts(self.perf.tas_to_cas(
             tas, self.weather.p, self.weather.rho))
 
@@ -373,7 +373,7 @@ class Traffic:
             self.ap.speed_mode == APSpeedMode.CONSTANT_CAS
         ],
             choicelist=[
-            self.perf.mach_to_tas(self.mach, self.weather.T),
+            self.perf.mach_to_tas_from_a(self.mach, self.weather.a),
             self.perf.cas_to_tas(Unit.kts2mps(
                 self.cas), self.weather.p, self.weather.rho)
         ],
@@ -388,12 +388,12 @@ class Traffic:
             choicelist=[
             self.perf.cas_to_tas(Unit.kts2mps(
                 self.cas), self.weather.p, self.weather.rho),
-            self.perf.mach_to_tas(self.mach, self.weather.T)
+            self.perf.mach_to_tas_from_a(self.mach, self.weather.a)
         ],
             default=tas)
 
         self.mach = np.where((self.speed_mode == SpeedMode.CAS) & ((self.ap.speed_mode == APSpeedMode.ACCELERATE) | (self.ap.speed_mode == APSpeedMode.DECELERATE)) & (self.cas == self.ap.cas),
-                             self.perf.tas_to_mach(tas, self.weather.T),
+                             self.perf.tas_to_mach_from_a(tas, self.weather.a),
                              self.mach)
 
         self.cas = np.where((self.speed_mode == SpeedMode.MACH) & ((self.ap.speed_mode == APSpeedMode.ACCELERATE) | (self.ap.speed_mode == APSpeedMode.DECELERATE)) & (self.mach == self.ap.mach),
@@ -33,6 +33,8 @@ class Weather:
         self.p = np.zeros([0])                                  # Pressure [Pa]
         # Density [kg/m^3]
         self.rho = np.zeros([0])
+        # Speed of sound [m/s]
+        self.a = np.zeros([0])
 
         # Download ERA5 data
         if self.mode == "ERA5":
@@ -54,6 +56,7 @@ class Weather:
             Unit.ft2m(alt), self.T[-1], self.d_T[-1]))
         self.rho = np.append(
             self.rho, perf.cal_air_density(self.p[-1], self.T[-1]))
+        self.a = np.append(self.a, perf.cal_speed_of_sound(self.T[-1]))
 
     def del_aircraft(self, index):
         self.wind_speed = np.delete(self.wind_speed, index)
@@ -65,6 +68,7 @@ class Weather:
         self.T = np.delete(self.T, index)
         self.p = np.delete(self.p, index)
         self.rho = np.delete(self.rho, index)
+        self.a = np.delete(self.a, index)
 
     def update(self, lat, long, alt, perf: Performance, global_time):
         if self.mode == "ERA5":
@@ -79,6 +83,4 @@ class Weather:
             self.wind_north = Unit.mps2kts(
                 np.array([x[i] for x, i in zip(ds['v'].values.T, index)]))
 
-        self.T = perf.cal_temperature(Unit.ft2m(alt), self.d_T)
-        self.p = perf.cal_air_pressure(Unit.ft2m(alt), self.T, self.d_T)
-        self.rho = perf.cal_air_density(self.p, self.T)
+        self.T, self.p, self.rho, self.a = perf.cal_atmosphere(Unit.ft2m(alt), self.d_T)